@@ -0,0 +1,110 @@
+"""add_achievement_monthly_rollups
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'm3n4o5p6q7r8'
+down_revision = 'l2m3n4o5p6q7'
+branch_labels = None
+depends_on = None
+
+
+# Verses per surah (index 0 is surah 1), frozen here so the migration never changes
+AYAH_COUNTS = [
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98,
+    135, 112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88,
+    75, 85, 54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29,
+    22, 24, 13, 14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28, 20, 56, 40, 31,
+    50, 40, 46, 42, 29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8,
+    19, 5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6,
+]
+
+
+def global_range(from_surah, from_verse, to_surah, to_verse):
+    """Inclusive global verse bounds of an achievement, None when the range does not exist"""
+    for surah, verse in ((from_surah, from_verse), (to_surah, to_verse)):
+        if not (1 <= surah <= len(AYAH_COUNTS) and 1 <= verse <= AYAH_COUNTS[surah - 1]):
+            return None
+    start = sum(AYAH_COUNTS[:from_surah - 1]) + from_verse
+    end = sum(AYAH_COUNTS[:to_surah - 1]) + to_verse
+    return (start, end) if start <= end else None
+
+
+def distinct_verses(ranges):
+    """Verses covered by possibly overlapping inclusive ranges"""
+    covered = 0
+    last_end = 0
+    for start, end in sorted(ranges):
+        start = max(start, last_end + 1)
+        if end >= start:
+            covered += end - start + 1
+            last_end = end
+    return covered
+
+
+def upgrade() -> None:
+    # Verses memorized / revised per student and month, ranked by the leaderboard
+    op.create_table(
+        'achievement_monthly_rollups',
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('verses_new', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('verses_revised', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('student_id', 'month')
+    )
+    op.create_index('ix_achievement_rollups_month_new', 'achievement_monthly_rollups', ['month', 'verses_new'])
+    op.create_index('ix_achievement_rollups_month_revised', 'achievement_monthly_rollups', ['month', 'verses_revised'])
+
+    # Backfill from existing achievements: distinct verses per month, normal
+    # achievements as new, small and big ones as revised
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT student_id, date_trunc('month', date)::date AS month, achievement_type::text, "
+        "from_surah, from_verse, to_surah, to_verse FROM achievements"
+    )).all()
+
+    ranges_by_month = {}
+    for student_id, month, achievement_type, *verse_range in rows:
+        new, revised = ranges_by_month.setdefault((student_id, month), ([], []))
+        bounds = global_range(*verse_range)
+        if bounds is not None:
+            (new if achievement_type == 'normal' else revised).append(bounds)
+
+    rollups = sa.table(
+        'achievement_monthly_rollups',
+        sa.column('student_id', sa.Integer()),
+        sa.column('month', sa.Date()),
+        sa.column('verses_new', sa.Integer()),
+        sa.column('verses_revised', sa.Integer()),
+        sa.column('updated_at', sa.DateTime(timezone=True))
+    )
+    now = datetime.now(timezone.utc)
+    backfill = [
+        {
+            'student_id': student_id,
+            'month': month,
+            'verses_new': distinct_verses(new),
+            'verses_revised': distinct_verses(revised),
+            'updated_at': now,
+        }
+        for (student_id, month), (new, revised) in ranges_by_month.items()
+    ]
+    if backfill:
+        op.bulk_insert(rollups, backfill)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_achievement_rollups_month_revised', table_name='achievement_monthly_rollups')
+    op.drop_index('ix_achievement_rollups_month_new', table_name='achievement_monthly_rollups')
+    op.drop_table('achievement_monthly_rollups')
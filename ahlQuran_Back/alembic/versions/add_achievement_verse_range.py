@@ -0,0 +1,70 @@
+"""add_achievement_verse_range
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'n4o5p6q7r8s9'
+down_revision = 'm3n4o5p6q7r8'
+branch_labels = None
+depends_on = None
+
+
+# Verses per surah (index 0 is surah 1), frozen here so the migration never changes
+AYAH_COUNTS = [
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98,
+    135, 112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88,
+    75, 85, 54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29,
+    22, 24, 13, 14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28, 20, 56, 40, 31,
+    50, 40, 46, 42, 29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8,
+    19, 5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6,
+]
+
+
+def upgrade() -> None:
+    offsets = ",".join(str(sum(AYAH_COUNTS[:surah])) for surah in range(len(AYAH_COUNTS)))
+    counts = ",".join(str(count) for count in AYAH_COUNTS)
+
+    # Mirrors app.quran.global_index, NULL instead of an error for a missing verse.
+    # IMMUTABLE so it can back a generated column.
+    op.execute(f"""
+        CREATE FUNCTION quran_global_index(surah integer, verse integer) RETURNS integer
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+            SELECT CASE
+                WHEN verse BETWEEN 1 AND (ARRAY[{counts}])[surah]
+                THEN (ARRAY[{offsets}])[surah] + verse
+            END
+        $$
+    """)
+    op.execute("""
+        CREATE FUNCTION quran_verse_range(from_surah integer, from_verse integer, to_surah integer, to_verse integer)
+        RETURNS int4range
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+            SELECT CASE
+                WHEN quran_global_index(from_surah, from_verse) <= quran_global_index(to_surah, to_verse)
+                THEN int4range(quran_global_index(from_surah, from_verse), quran_global_index(to_surah, to_verse), '[]')
+            END
+        $$
+    """)
+
+    op.add_column('achievements', sa.Column(
+        'verse_range',
+        postgresql.INT4RANGE(),
+        sa.Computed('quran_verse_range(from_surah, from_verse, to_surah, to_verse)', persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_achievements_verse_range', 'achievements', ['verse_range'], postgresql_using='gist')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_achievements_verse_range', table_name='achievements')
+    op.drop_column('achievements', 'verse_range')
+    op.execute("DROP FUNCTION quran_verse_range(integer, integer, integer, integer)")
+    op.execute("DROP FUNCTION quran_global_index(integer, integer)")
@@ -0,0 +1,56 @@
+"""add_attendance_monthly_rollups
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'j0k1l2m3n4o5'
+down_revision = 'i9j0k1l2m3n4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-student, per-month attendance counters
+    op.create_table(
+        'attendance_monthly_rollups',
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('present', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('late', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('absent', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('excused', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('student_id', 'month')
+    )
+    op.create_index(op.f('ix_attendance_monthly_rollups_month'), 'attendance_monthly_rollups', ['month'], unique=False)
+
+    # Backfill from existing attendance
+    op.execute("""
+        INSERT INTO attendance_monthly_rollups
+            (student_id, month, present, late, absent, excused, total, updated_at)
+        SELECT
+            student_id,
+            date_trunc('month', date)::date,
+            COUNT(*) FILTER (WHERE status = 'present'),
+            COUNT(*) FILTER (WHERE status = 'late'),
+            COUNT(*) FILTER (WHERE status = 'absent'),
+            COUNT(*) FILTER (WHERE status = 'excused'),
+            COUNT(*),
+            now()
+        FROM attendances
+        GROUP BY student_id, date_trunc('month', date)::date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_attendance_monthly_rollups_month'), table_name='attendance_monthly_rollups')
+    op.drop_table('attendance_monthly_rollups')
@@ -0,0 +1,76 @@
+"""add_lecture_changed_at
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'o5p6q7r8s9t0'
+down_revision = 'n4o5p6q7r8s9'
+branch_labels = None
+depends_on = None
+
+
+# Child tables rendered as part of a lecture by the delta sync API
+LECTURE_CHILD_TABLES = ['lecture_teachers', 'weekly_schedules']
+
+
+def upgrade() -> None:
+    # Last change of anything the sync API renders for a lecture. Unlike updated_at
+    # it also moves for student_count and for teacher / schedule changes.
+    op.add_column(
+        'lectures',
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+    )
+    op.execute("UPDATE lectures SET changed_at = COALESCE(updated_at, created_at, now())")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION touch_lecture_changed_at() RETURNS trigger AS $$
+        BEGIN
+            -- No-op updates (e.g. a counter rebuild finding no drift) keep the timestamp
+            IF TG_OP = 'INSERT' OR NEW IS DISTINCT FROM OLD THEN
+                NEW.changed_at := clock_timestamp();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER lectures_changed_at
+        BEFORE INSERT OR UPDATE ON lectures
+        FOR EACH ROW EXECUTE FUNCTION touch_lecture_changed_at()
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION touch_parent_lecture() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE lectures SET changed_at = clock_timestamp() WHERE id = OLD.lecture_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE lectures SET changed_at = clock_timestamp() WHERE id = NEW.lecture_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in LECTURE_CHILD_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_touch_lecture
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION touch_parent_lecture()
+        """)
+
+
+def downgrade() -> None:
+    for table in LECTURE_CHILD_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_touch_lecture ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS touch_parent_lecture()")
+    op.execute("DROP TRIGGER IF EXISTS lectures_changed_at ON lectures")
+    op.execute("DROP FUNCTION IF EXISTS touch_lecture_changed_at()")
+    op.drop_column('lectures', 'changed_at')
@@ -0,0 +1,89 @@
+"""add_memorization_coverages
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'l2m3n4o5p6q7'
+down_revision = 'k1l2m3n4o5p6'
+branch_labels = None
+depends_on = None
+
+
+# Verses per surah (index 0 is surah 1), frozen here so the migration never changes
+AYAH_COUNTS = [
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98,
+    135, 112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88,
+    75, 85, 54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29,
+    22, 24, 13, 14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28, 20, 56, 40, 31,
+    50, 40, 46, 42, 29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8,
+    19, 5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6,
+]
+
+# Bytes of the bitmap, one bit per verse: verse i is bit i - 1, little-endian
+BITMAP_BYTES = (sum(AYAH_COUNTS) + 7) // 8
+
+
+def global_range(from_surah, from_verse, to_surah, to_verse):
+    """Inclusive global verse bounds of an achievement, None when the range does not exist"""
+    for surah, verse in ((from_surah, from_verse), (to_surah, to_verse)):
+        if not (1 <= surah <= len(AYAH_COUNTS) and 1 <= verse <= AYAH_COUNTS[surah - 1]):
+            return None
+    start = sum(AYAH_COUNTS[:from_surah - 1]) + from_verse
+    end = sum(AYAH_COUNTS[:to_surah - 1]) + to_verse
+    return (start, end) if start <= end else None
+
+
+def upgrade() -> None:
+    # One bit per verse of the Quran covered by a student's achievements
+    op.create_table(
+        'memorization_coverages',
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('bitmap', sa.LargeBinary(), nullable=False),
+        sa.Column('verse_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('student_id')
+    )
+
+    # Backfill from existing achievements
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT student_id, from_surah, from_verse, to_surah, to_verse FROM achievements"
+    )).all()
+
+    bits_by_student = {}
+    for student_id, *verse_range in rows:
+        bounds = global_range(*verse_range)
+        bits = bits_by_student.setdefault(student_id, 0)
+        if bounds is not None:
+            start, end = bounds
+            bits |= ((1 << (end - start + 1)) - 1) << (start - 1)
+        bits_by_student[student_id] = bits
+
+    coverages = sa.table(
+        'memorization_coverages',
+        sa.column('student_id', sa.Integer()),
+        sa.column('bitmap', sa.LargeBinary()),
+        sa.column('verse_count', sa.Integer())
+    )
+    backfill = [
+        {
+            'student_id': student_id,
+            'bitmap': bits.to_bytes(BITMAP_BYTES, 'little'),
+            'verse_count': bits.bit_count(),
+        }
+        for student_id, bits in bits_by_student.items()
+    ]
+    if backfill:
+        op.bulk_insert(coverages, backfill)
+
+
+def downgrade() -> None:
+    op.drop_table('memorization_coverages')
@@ -0,0 +1,41 @@
+"""add_student_count_to_lectures
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'g7h8i9j0k1l2'
+down_revision = 'f6g7h8i9j0k1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add denormalized enrollment counter to lectures
+    op.add_column(
+        'lectures',
+        sa.Column('student_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    
+    # Backfill counters from existing participations
+    op.execute("""
+        UPDATE lectures
+        SET student_count = counts.student_count
+        FROM (
+            SELECT lecture_id, COUNT(DISTINCT student_id) AS student_count
+            FROM session_participations
+            WHERE lecture_id IS NOT NULL
+            GROUP BY lecture_id
+        ) AS counts
+        WHERE counts.lecture_id = lectures.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('lectures', 'student_count')
@@ -0,0 +1,74 @@
+"""add_sync_tracking
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'k1l2m3n4o5p6'
+down_revision = 'j0k1l2m3n4o5'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose deletions are recorded for the delta sync API
+SYNCED_TABLES = [
+    'lectures',
+    'students',
+    'session_participations',
+    'attendances',
+    'achievements',
+]
+
+
+def upgrade() -> None:
+    # Change timestamps for rows that had none
+    for table in ['users', 'students']:
+        op.add_column(
+            table,
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+        )
+
+    op.create_table(
+        'sync_tombstones',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('table_name', sa.String(length=63), nullable=False),
+        sa.Column('row_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sync_tombstones_deleted_at'), 'sync_tombstones', ['deleted_at'], unique=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_sync_tombstone() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO sync_tombstones (table_name, row_id, deleted_at)
+            VALUES (TG_TABLE_NAME, OLD.id, clock_timestamp());
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in SYNCED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_sync_tombstone
+            AFTER DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION record_sync_tombstone()
+        """)
+
+
+def downgrade() -> None:
+    for table in SYNCED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_tombstone ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_sync_tombstone()")
+
+    op.drop_index(op.f('ix_sync_tombstones_deleted_at'), table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+
+    for table in ['students', 'users']:
+        op.drop_column(table, 'updated_at')
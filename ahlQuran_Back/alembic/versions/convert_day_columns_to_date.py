@@ -0,0 +1,51 @@
+"""convert_day_columns_to_date
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'i9j0k1l2m3n4'
+down_revision = 'h8i9j0k1l2m3'
+branch_labels = None
+depends_on = None
+
+
+# Tables storing a calendar day as DD-MM-YYYY text
+DAY_TABLES = ['attendances', 'teacher_attendances', 'achievements']
+
+
+def upgrade() -> None:
+    # Convert DD-MM-YYYY strings to DATE in place; existing indexes
+    # (including the unique (student_id, date) / (teacher_id, date) ones) are rebuilt
+    for table in DAY_TABLES:
+        op.alter_column(
+            table,
+            'date',
+            type_=sa.Date(),
+            existing_type=sa.String(length=10),
+            existing_nullable=False,
+            postgresql_using="to_date(date, 'DD-MM-YYYY')"
+        )
+
+    # Composite index so per-student date ranges are index range scans
+    op.create_index('ix_achievements_student_date', 'achievements', ['student_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_achievements_student_date', table_name='achievements')
+
+    for table in DAY_TABLES:
+        op.alter_column(
+            table,
+            'date',
+            type_=sa.String(length=10),
+            existing_type=sa.Date(),
+            existing_nullable=False,
+            postgresql_using="to_char(date, 'DD-MM-YYYY')"
+        )
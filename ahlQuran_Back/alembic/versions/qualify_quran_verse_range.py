@@ -0,0 +1,44 @@
+"""qualify_quran_verse_range
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'r8s9t0u1v2w3'
+down_revision = 'q7r8s9t0u1v2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # pg_dump restores with an empty search_path and recomputes generated columns
+    # during COPY, so the helper must be schema-qualified. No SET search_path on
+    # the function: it would stop PostgreSQL from inlining it.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION quran_verse_range(from_surah integer, from_verse integer, to_surah integer, to_verse integer)
+        RETURNS int4range
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+            SELECT CASE
+                WHEN public.quran_global_index(from_surah, from_verse) <= public.quran_global_index(to_surah, to_verse)
+                THEN int4range(public.quran_global_index(from_surah, from_verse), public.quran_global_index(to_surah, to_verse), '[]')
+            END
+        $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION quran_verse_range(from_surah integer, from_verse integer, to_surah integer, to_verse integer)
+        RETURNS int4range
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+            SELECT CASE
+                WHEN quran_global_index(from_surah, from_verse) <= quran_global_index(to_surah, to_verse)
+                THEN int4range(quran_global_index(from_surah, from_verse), quran_global_index(to_surah, to_verse), '[]')
+            END
+        $$
+    """)
@@ -0,0 +1,99 @@
+"""scope_sync_tombstones
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'p6q7r8s9t0u1'
+down_revision = 'o5p6q7r8s9t0'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose deletions are recorded for the delta sync API
+SYNCED_TABLES = [
+    'lectures',
+    'students',
+    'session_participations',
+    'attendances',
+    'achievements',
+]
+
+
+def upgrade() -> None:
+    # Teachers allowed to see the deleted row, so teachers only receive their own deletions
+    op.add_column('sync_tombstones', sa.Column('teacher_ids', postgresql.ARRAY(sa.Integer()), nullable=True))
+    op.create_index(
+        'ix_sync_tombstones_teacher_ids', 'sync_tombstones', ['teacher_ids'], postgresql_using='gin'
+    )
+
+    # BEFORE DELETE so the enrollments and lecture teachers of the row still exist when
+    # its audience is resolved. Rows removed by a cascade may find them already gone;
+    # clients drop those together with the deleted parent.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_sync_tombstone() RETURNS trigger AS $$
+        DECLARE
+            audience integer[];
+        BEGIN
+            IF TG_TABLE_NAME = 'lectures' THEN
+                SELECT array_agg(teacher_id) INTO audience
+                FROM lecture_teachers WHERE lecture_id = OLD.id;
+            ELSIF TG_TABLE_NAME = 'session_participations' THEN
+                SELECT array_agg(teacher_id) INTO audience
+                FROM lecture_teachers WHERE lecture_id = OLD.lecture_id;
+            ELSIF TG_TABLE_NAME = 'students' THEN
+                SELECT array_agg(DISTINCT lt.teacher_id) INTO audience
+                FROM session_participations sp
+                JOIN lecture_teachers lt ON lt.lecture_id = sp.lecture_id
+                WHERE sp.student_id = OLD.id;
+            ELSE
+                SELECT array_agg(DISTINCT lt.teacher_id) INTO audience
+                FROM session_participations sp
+                JOIN lecture_teachers lt ON lt.lecture_id = sp.lecture_id
+                WHERE sp.student_id = OLD.student_id;
+            END IF;
+
+            INSERT INTO sync_tombstones (table_name, row_id, teacher_ids, deleted_at)
+            VALUES (TG_TABLE_NAME, OLD.id, audience, clock_timestamp());
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in SYNCED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_tombstone ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER {table}_sync_tombstone
+            BEFORE DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION record_sync_tombstone()
+        """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_sync_tombstone() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO sync_tombstones (table_name, row_id, deleted_at)
+            VALUES (TG_TABLE_NAME, OLD.id, clock_timestamp());
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in SYNCED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_tombstone ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER {table}_sync_tombstone
+            AFTER DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION record_sync_tombstone()
+        """)
+
+    op.drop_index('ix_sync_tombstones_teacher_ids', table_name='sync_tombstones')
+    op.drop_column('sync_tombstones', 'teacher_ids')
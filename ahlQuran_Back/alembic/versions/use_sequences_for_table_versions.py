@@ -0,0 +1,98 @@
+"""use_sequences_for_table_versions
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'q7r8s9t0u1v2'
+down_revision = 'p6q7r8s9t0u1'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose changes invalidate list ETags
+TRACKED_TABLES = [
+    'users',
+    'students',
+    'teachers',
+    'guardians',
+    'lectures',
+    'lecture_teachers',
+    'weekly_schedules',
+    'session_participations',
+]
+
+
+def upgrade() -> None:
+    # One sequence per table instead of a shared counter row: nextval takes no
+    # transactional lock, so writers no longer queue (or deadlock) on the counters
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}")
+        op.execute(f"CREATE SEQUENCE {table}_version_seq")
+        # Called once so last_value already moves on the first bump
+        op.execute(f"SELECT nextval('{table}_version_seq')")
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version()")
+    op.drop_table('table_versions')
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            PERFORM nextval(TG_TABLE_NAME || '_version_seq');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in TRACKED_TABLES:
+        # Deferred to commit time: a sequence bump is visible at once, so bumping
+        # early would announce a new version while its rows are still invisible
+        op.execute(f"""
+            CREATE CONSTRAINT TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION bump_table_version()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_version_truncate
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        """)
+
+
+def downgrade() -> None:
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version_truncate ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version()")
+
+    op.create_table(
+        'table_versions',
+        sa.Column('table_name', sa.String(length=63), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO table_versions (table_name, version)
+            VALUES (TG_TABLE_NAME, 1)
+            ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in TRACKED_TABLES:
+        op.execute(f"INSERT INTO table_versions (table_name, version) VALUES ('{table}', 0)")
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        """)
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_version_seq")
@@ -0,0 +1,102 @@
+import asyncio
+import sys
+
+from app.db.session import SessionLocal
+import app.models  # noqa: F401  (register every mapper before querying)
+from app.services.enrollment import rebuild_lecture_student_counts, find_lecture_count_drift
+from app.services.attendance_rollup import rebuild_attendance_rollups
+from app.services.sync import prune_sync_tombstones
+from app.services.coverage import rebuild_all_coverage
+from app.services.achievement_rollup import rebuild_achievement_rollups
+
+
+async def rebuild_lecture_counts():
+    """Recompute every lecture enrollment counter from session participations"""
+    async with SessionLocal() as session:
+        updated = await rebuild_lecture_student_counts(session)
+        await session.commit()
+
+        print(f"✅ Rebuilt student counters for {updated} lecture(s)")
+        return True
+
+
+async def verify_lecture_counts():
+    """Report lectures whose stored counter differs from the actual enrollment"""
+    async with SessionLocal() as session:
+        drift = await find_lecture_count_drift(session)
+
+        if not drift:
+            print("✅ All lecture student counters are in sync")
+            return True
+
+        print(f"❌ Found {len(drift)} lecture(s) with drifted counters:\n")
+        for lecture_id, stored, actual in drift:
+            print(f"  Lecture {lecture_id}: stored={stored} actual={actual}")
+        print("\nRun `python -m app.Cli.maintenance rebuild-lecture-counts` to fix them.")
+        return False
+
+
+async def rebuild_attendance_rollup():
+    """Recompute the monthly attendance rollup from the attendance records"""
+    async with SessionLocal() as session:
+        written = await rebuild_attendance_rollups(session)
+        await session.commit()
+
+        print(f"✅ Rebuilt {written} monthly attendance rollup row(s)")
+        return True
+
+
+async def prune_tombstones():
+    """Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS"""
+    async with SessionLocal() as session:
+        removed = await prune_sync_tombstones(session)
+        await session.commit()
+
+        print(f"✅ Pruned {removed} sync tombstone(s)")
+        return True
+
+
+async def rebuild_coverage():
+    """Recompute every student's memorization coverage bitmap from achievements"""
+    async with SessionLocal() as session:
+        students = await rebuild_all_coverage(session)
+        await session.commit()
+
+        print(f"✅ Rebuilt memorization coverage for {students} student(s)")
+        return True
+
+
+async def rebuild_achievement_rollup():
+    """Recompute the monthly achievement rollup behind the leaderboard"""
+    async with SessionLocal() as session:
+        written = await rebuild_achievement_rollups(session)
+        await session.commit()
+
+        print(f"✅ Rebuilt {written} monthly achievement rollup row(s)")
+        return True
+
+
+COMMANDS = {
+    "rebuild-lecture-counts": rebuild_lecture_counts,
+    "verify-lecture-counts": verify_lecture_counts,
+    "rebuild-attendance-rollups": rebuild_attendance_rollup,
+    "prune-sync-tombstones": prune_tombstones,
+    "rebuild-memorization-coverage": rebuild_coverage,
+    "rebuild-achievement-rollups": rebuild_achievement_rollup,
+}
+
+
+def main():
+    """CLI entry point"""
+    if len(sys.argv) != 2 or sys.argv[1] not in COMMANDS:
+        print("Usage:")
+        for command in COMMANDS:
+            print(f"  python -m app.Cli.maintenance {command}")
+        sys.exit(1)
+
+    ok = asyncio.run(COMMANDS[sys.argv[1]]())
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from .teacher import teacherRouter
 from .student import studentRouter
 from .lectures import lectureRouter
 from .guardian import router as guardianRouter
+from .sync import syncRouter
+from .achievements import achievementRouter
 
 def register_routes(app):
     routes = [
@@ -19,6 +21,8 @@ def register_routes(app):
         (studentRouter, "/students", ["Students"]),
         (lectureRouter, "/lectures", ["Lectures"]),
         (guardianRouter, "/guardians", ["Guardians"]),
+        (syncRouter, "/sync", ["Sync"]),
+        (achievementRouter, "/achievements", ["Achievements"]),
     ]
 
     for router, prefix, tags in routes:
@@ -0,0 +1,113 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.dialects.postgresql import Range
+from typing import Optional
+
+from app.db.session import get_db
+from app.core.dependencies import require_president_or_supervisor
+from app.core.principals import Principal
+from app.core.pagination import count_total
+from app.models.user import User
+from app.models.student import Student
+from app.models.acheivements import Achievement
+from app.models.sessionParticipation import SessionParticipation
+from app.schemas.achievement import AchievementType
+from app.schemas.coverage import CoveringStudent, CoveringStudentList
+from app.quran import AYAH_COUNTS, SURAH_COUNT, range_indices
+
+achievementRouter = APIRouter()
+
+
+@achievementRouter.get("/covering", response_model=CoveringStudentList)
+async def get_students_covering(
+    surah: int = Query(..., ge=1, le=SURAH_COUNT),
+    from_verse: int = Query(1, ge=1),
+    to_verse: Optional[int] = Query(None, ge=1, description="Defaults to the last verse of the surah"),
+    achievement_type: Optional[AchievementType] = None,
+    lecture_id: Optional[int] = None,
+    complete_only: bool = False,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Students whose achievements overlap a verse range of a surah, with how many of its
+    verses they covered, most covered first. Uses the GiST index on
+    achievements.verse_range and groups per student in the database.
+    `complete_only` keeps the students who covered the whole range.
+    """
+    if to_verse is None:
+        to_verse = AYAH_COUNTS[surah]
+
+    try:
+        start, end = range_indices(surah, from_verse, surah, to_verse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    requested = Range(start, end, bounds="[]")
+    range_size = end - start + 1
+
+    filters = [Achievement.verse_range.overlaps(requested)]
+    if achievement_type is not None:
+        filters.append(Achievement.achievement_type == achievement_type.value)
+    if lecture_id is not None:
+        filters.append(
+            Achievement.student_id.in_(
+                select(SessionParticipation.student_id).where(SessionParticipation.lecture_id == lecture_id)
+            )
+        )
+
+    # Parts of the requested range covered by each student, merged into a multirange
+    per_student = (
+        select(
+            Achievement.student_id,
+            func.range_agg(Achievement.verse_range.intersection(requested)).label("ranges")
+        )
+        .where(*filters)
+        .group_by(Achievement.student_id)
+        .subquery()
+    )
+    piece = func.unnest(per_student.c.ranges).column_valued("piece")
+    # Discrete ranges are normalized to [lower, upper)
+    verse_total = select(func.sum(func.upper(piece) - func.lower(piece))).scalar_subquery()
+    covered = select(
+        per_student.c.student_id,
+        cast(verse_total, Integer).label("covered_verses")
+    ).subquery()
+
+    query = (
+        select(covered.c.student_id, covered.c.covered_verses, User.firstname, User.lastname)
+        .join(Student, Student.id == covered.c.student_id)
+        .join(User, User.id == Student.user_id)
+    )
+    if complete_only:
+        query = query.where(covered.c.covered_verses == range_size)
+
+    result = await db.execute(
+        query.order_by(covered.c.covered_verses.desc(), covered.c.student_id).offset(skip).limit(limit)
+    )
+    rows = result.all()
+
+    total = await count_total(db, query)
+
+    return CoveringStudentList(
+        surah=surah,
+        from_verse=from_verse,
+        to_verse=to_verse,
+        verse_count=range_size,
+        students=[
+            CoveringStudent(
+                student_id=row.student_id,
+                firstname=row.firstname,
+                lastname=row.lastname,
+                covered_verses=row.covered_verses,
+                complete=row.covered_verses == range_size
+            )
+            for row in rows
+        ],
+        total=total
+    )
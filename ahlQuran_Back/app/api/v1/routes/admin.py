@@ -11,6 +11,10 @@ from app.db.session import get_db
 from app.models.user import User, UserRoleEnum
 from app.models.president import President
 from app.core.dependencies import require_admin
+from app.core.principals import Principal, invalidate_user_principal, principal_cache
+from app.core.security import token_cache
+from app.core.pagination import count_cache
+from app.core.response_cache import get_response_cache
 import logging
 
 
@@ -91,6 +95,7 @@ async def approve_president(
     
     await db.commit()
     await db.refresh(user)
+    invalidate_user_principal(user.id)
     
     return {
         "message": f"President {user.email} has been approved",
@@ -110,7 +115,7 @@ async def approve_president(
 async def reject_president(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    admin: User = Depends(require_admin)  # ← Only admins
+    admin: Principal = Depends(require_admin)  # ← Only admins
 ):
     result = await db.execute(
         select(User).where(User.id == user_id)
@@ -138,6 +143,7 @@ async def reject_president(
     # Delete the user (cascade will delete president profile)
     await db.delete(user)
     await db.commit()
+    invalidate_user_principal(user_id)
     
     return None  # 204 No Content
 
@@ -145,7 +151,7 @@ async def reject_president(
 @adminRouter.get("/all-users")
 async def list_all_users(
     db: AsyncSession = Depends(get_db),
-    admin: User = Depends(require_admin)  # ← Only admins
+    admin: Principal = Depends(require_admin)  # ← Only admins
 ):
     """
     ADMIN ONLY: List all users in the system.
@@ -198,6 +204,7 @@ async def deactivate_user(
     user.is_active = False
     await db.commit()
     await db.refresh(user)
+    invalidate_user_principal(user.id)
     
     return {
         "message": f"User {user.email} has been deactivated",
@@ -206,4 +213,18 @@ async def deactivate_user(
             "email": user.email,
             "is_active": user.is_active
         }
-    }
\ No newline at end of file
+    }
+
+@adminRouter.get("/cache-stats")
+async def get_cache_stats(
+    admin = Depends(require_admin)
+):
+    """
+    ADMIN ONLY: Hit/miss counters of the in-process caches of this worker.
+    """
+    return {
+        "tokens": token_cache.stats(),
+        "principals": principal_cache.stats(),
+        "counts": count_cache.stats(),
+        "responses": get_response_cache().stats(),
+    }
@@ -8,7 +8,7 @@ from app.db.session import get_db
 from app.models.admin import Admin
 from app.models.user import User, UserRoleEnum
 from app.models.president import President
-from app.core.security import create_access_token, verify_password
+from app.core.security import create_access_token, check_password
 from app.core.config import settings
 from app.schemas.auth import (
     AdminLoginReq,
@@ -18,6 +18,7 @@ from app.schemas.auth import (
     Token
 )
 from app.core.dependencies import get_current_user, require_admin
+from app.core.principals import Principal
 
 authRouter = APIRouter()
 logger = logging.getLogger(__name__)
@@ -186,7 +187,7 @@ async def supervisor_login(
         )
 
     # Verify password using bcrypt
-    if not verify_password(form_data.password, user.hashed_password):
+    if not await check_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='wrong email or password',
@@ -303,8 +304,17 @@ async def admin_login(
 # ========== GET CURRENT USER INFO ==========
 @authRouter.get("/me")
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
+    # The cached principal carries no relationships, load the president profile explicitly
+    president = None
+    if current_user.role == UserRoleEnum.PRESIDENT:
+        result = await db.execute(
+            select(President).where(President.user_id == current_user.id)
+        )
+        president = result.scalar_one_or_none()
+
     return {
         "id": current_user.id,
         "email": current_user.email,
@@ -314,10 +324,10 @@ async def get_current_user_info(
         "is_active": current_user.is_active,
         # Include president info if available
         "president": {
-            "school_name": current_user.president.school_name,
-            "phone_number": current_user.president.phone_number,
-            "isVerified": current_user.president.isVerified
-        } if current_user.president else None
+            "school_name": president.school_name,
+            "phone_number": president.phone_number,
+            "isVerified": president.is_verified
+        } if president else None
     }
 
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -11,8 +11,11 @@ from app.models.student import Student
 from app.schemas.guardian import (
     GuardianCreate, GuardianUpdate, GuardianResponse, GuardianListResponse
 )
-from app.core.security import get_password_hash
+from app.core.security import hash_password
+from app.core.pagination import count_total
+from app.core.etag import GUARDIAN_LIST_TABLES, check_not_modified
 from app.core.dependencies import require_president_or_supervisor
+from app.core.principals import Principal, invalidate_user_principal
 
 router = APIRouter()
 
@@ -21,7 +24,7 @@ router = APIRouter()
 async def create_guardian(
     guardian_data: GuardianCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Create a new guardian"""
     
@@ -42,7 +45,7 @@ async def create_guardian(
         firstname=guardian_data.guardian_info.first_name,
         lastname=guardian_data.guardian_info.last_name,
         email=guardian_data.guardian_info.email,
-        hashed_password=get_password_hash(guardian_data.account_info.password),
+        hashed_password=await hash_password(guardian_data.account_info.password),
         role=UserRoleEnum.STUDENT,  # Using existing role enum
         is_active=True
     )
@@ -100,12 +103,18 @@ async def create_guardian(
 
 @router.get("/", response_model=GuardianListResponse)
 async def get_guardians(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Get all guardians"""
+
+    not_modified = await check_not_modified(db, request, response, GUARDIAN_LIST_TABLES)
+    if not_modified is not None:
+        return not_modified
     
     # Get guardians with pagination and load student relationship
     result = await db.execute(
@@ -119,10 +128,8 @@ async def get_guardians(
     )
     guardians = result.scalars().all()
     
-    # Efficient count using func.count()
-    from sqlalchemy import func
-    count_result = await db.execute(select(func.count(Guardian.id)))
-    total = count_result.scalar()
+    # Get total count
+    total = await count_total(db, select(Guardian), cache_key="guardians")
     
     guardian_responses = []
     for guardian in guardians:
@@ -158,7 +165,7 @@ async def get_guardians(
 async def get_guardian(
     guardian_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Get a specific guardian by ID"""
     
@@ -209,7 +216,7 @@ async def update_guardian(
     guardian_id: int,
     guardian_data: GuardianUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Update a guardian"""
     
@@ -246,11 +253,12 @@ async def update_guardian(
     
     # Update account info if provided
     if guardian_data.account_info and guardian_data.account_info.get("password"):
-        guardian.user.hashed_password = get_password_hash(
+        guardian.user.hashed_password = await hash_password(
             guardian_data.account_info["password"]
         )
     
     await db.commit()
+    invalidate_user_principal(guardian.user_id)
     
     # Reload guardian with relationships
     result = await db.execute(
@@ -293,7 +301,7 @@ async def update_guardian(
 async def delete_guardian(
     guardian_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Delete a guardian"""
     
@@ -311,5 +319,6 @@ async def delete_guardian(
     # Delete user (cascade will delete guardian)
     await db.delete(guardian.user)
     await db.commit()
+    invalidate_user_principal(guardian.user_id)
     
     return None
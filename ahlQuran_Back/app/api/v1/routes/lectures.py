@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert
 from sqlalchemy.orm import joinedload
-from typing import List
+from typing import List, Optional
 
 from app.db.session import get_db
-from app.core.dependencies import require_president_or_supervisor
+from app.core.dependencies import require_president_or_supervisor, require_teacher_or_above
+from app.core.principals import Principal
+from app.core.etag import LECTURE_LIST_TABLES, compute_list_etag, etag_matches, not_modified_response, set_etag_headers
+from app.core.response_cache import (
+    LECTURE_CATALOGUE, get_response_cache, response_cache_key, invalidate_namespace
+)
 from app.schemas.lecture import (
     LectureCreate,
     LectureUpdate,
@@ -14,22 +20,93 @@ from app.schemas.lecture import (
     TeacherResponse,
     WeeklyScheduleResponse
 )
-from app.models.lecture import Lecture, WeeklySchedule
+from app.schemas.attendance import LectureAttendanceBulk, AttendanceList, AttendanceSummary
+from app.schemas.types import DayDate
+from app.schemas.coverage import LectureCoverageResponse, StudentCoverageSummary
+from app.schemas.achievement import LectureAchievementBulk, AchievementList
+from app.models.lecture import Lecture, WeeklySchedule, lecture_teachers
 from app.models.teacher import Teacher
-from app.models.user import User
+from app.models.user import UserRoleEnum
+from app.models.attendance import Attendance
 from app.models.sessionParticipation import SessionParticipation
+from app.services.attendance import upsert_attendances, summarize_attendance, build_attendance_summary
+from app.services.attendance_rollup import refresh_attendance_rollups
+from app.services.coverage import merge_by_type, achievement_coverage_query, add_to_coverage
+from app.services.achievement_rollup import refresh_achievement_rollups
+from app.models.acheivements import Achievement
+from app.quran import covered_count, range_indices
+from app.core.dates import day_filters
+import logging
+
+logger = logging.getLogger(__name__)
 
 lectureRouter = APIRouter()
 
+lecture_list_adapter = TypeAdapter(List[LectureResponse])
+
+
+def lectures_with_details_query():
+    """Select lectures with teachers and schedules eagerly loaded"""
+    return select(Lecture).options(
+        joinedload(Lecture.teachers).joinedload(Teacher.user),
+        joinedload(Lecture.schedules)
+    )
+
+
+def map_lecture_to_response(lecture: Lecture) -> LectureResponse:
+    """Helper to map DB Lecture model (with teachers and schedules loaded) to LectureResponse"""
+
+    # Build teacher response
+    teachers_data = []
+    for teacher in lecture.teachers:
+        teachers_data.append(TeacherResponse(
+            teacher_id=teacher.id,
+            first_name=teacher.user.firstname if teacher.user else None,
+            last_name=teacher.user.lastname if teacher.user else None
+        ))
+
+    # Build schedules response
+    schedules_data = []
+    for schedule in lecture.schedules:
+        schedules_data.append(WeeklyScheduleResponse(
+            weekly_schedule_id=schedule.id,
+            lecture_id=schedule.lecture_id,
+            day_of_week=schedule.day_of_week,
+            start_time=schedule.start_time,
+            end_time=schedule.end_time
+        ))
+
+    return LectureResponse(
+        lecture_id=lecture.id,
+        lecture_name_ar=lecture.lecture_name_ar,
+        lecture_name_en=lecture.lecture_name_en,
+        circle_type=lecture.circle_type,
+        category=lecture.category,
+        shown_on_website=lecture.shown_on_website,
+        teachers=teachers_data,
+        schedules=schedules_data,
+        student_count=lecture.student_count,
+        created_at=lecture.created_at,
+        updated_at=lecture.updated_at
+    )
+
 
 @lectureRouter.get("/", response_model=List[LectureResponse])
 async def get_lectures_basic(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """
     Get basic list of lectures (for dropdowns, etc.)
+    Served from the response cache until a lecture or enrollment changes.
     """
+    cache = get_response_cache()
+    cache_key = response_cache_key(request, LECTURE_CATALOGUE)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     result_query = await db.execute(select(Lecture))
     lectures = result_query.scalars().all()
     
@@ -44,93 +121,60 @@ async def get_lectures_basic(
             "shown_on_website": lecture.shown_on_website,
             "teachers": [],
             "schedules": [],
-            "student_count": 0,
+            "student_count": lecture.student_count,
             "created_at": lecture.created_at,
             "updated_at": lecture.updated_at
         })
     
-    return result
+    body = lecture_list_adapter.dump_json(lecture_list_adapter.validate_python(result))
+    await cache.set(cache_key, body)
+
+    return Response(content=body, media_type="application/json")
 
 
 @lectureRouter.get("/special/lectures", response_model=List[LectureResponse])
 async def get_all_lectures(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """
     Get all lectures with full details including teachers, schedules, and student count
+    Served from the response cache until a lecture or enrollment changes, and
+    answered with 304 Not Modified when If-None-Match carries the current ETag.
     """
-    result_query = await db.execute(
-        select(Lecture).options(
-            joinedload(Lecture.teachers).joinedload(Teacher.user),
-            joinedload(Lecture.schedules)
-        )
-    )
-    lectures = result_query.scalars().unique().all()
-    
-    result = []
-    for lecture in lectures:
-        # Get student count for this lecture
-        count_query = await db.execute(
-            select(func.count(func.distinct(SessionParticipation.student_id))).where(
-                SessionParticipation.lecture_id == lecture.id
-            )
-        )
-        student_count = count_query.scalar() or 0
-        
-        # Build teacher response
-        teachers_data = []
-        for teacher in lecture.teachers:
-            teachers_data.append(TeacherResponse(
-                teacher_id=teacher.id,
-                first_name=teacher.user.firstname if teacher.user else None,
-                last_name=teacher.user.lastname if teacher.user else None
-            ))
-        
-        # Build schedules response
-        schedules_data = []
-        for schedule in lecture.schedules:
-            schedules_data.append(WeeklyScheduleResponse(
-                weekly_schedule_id=schedule.id,
-                lecture_id=schedule.lecture_id,
-                day_of_week=schedule.day_of_week,
-                start_time=schedule.start_time,
-                end_time=schedule.end_time
-            ))
-        
-        result.append(LectureResponse(
-            lecture_id=lecture.id,
-            lecture_name_ar=lecture.lecture_name_ar,
-            lecture_name_en=lecture.lecture_name_en,
-            circle_type=lecture.circle_type,
-            category=lecture.category,
-            shown_on_website=lecture.shown_on_website,
-            teachers=teachers_data,
-            schedules=schedules_data,
-            student_count=student_count,
-            created_at=lecture.created_at,
-            updated_at=lecture.updated_at
-        ))
-    
-    return result
+    etag = await compute_list_etag(db, request, LECTURE_LIST_TABLES)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    cache = get_response_cache()
+    cache_key = response_cache_key(request, LECTURE_CATALOGUE, version=etag)
+    body = await cache.get(cache_key)
+    if body is None:
+        result_query = await db.execute(lectures_with_details_query().order_by(Lecture.id))
+        lectures = result_query.scalars().unique().all()
+
+        body = lecture_list_adapter.dump_json([map_lecture_to_response(lecture) for lecture in lectures])
+        await cache.set(cache_key, body)
+
+    response = Response(content=body, media_type="application/json")
+    set_etag_headers(response, etag)
+    return response
 
 
 @lectureRouter.get("/special/lectures/{lecture_id}", response_model=LectureResponse)
 async def get_lecture_by_id(
     lecture_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """
     Get a single lecture by ID with full details
     """
     result_query = await db.execute(
-        select(Lecture).options(
-            joinedload(Lecture.teachers).joinedload(Teacher.user),
-            joinedload(Lecture.schedules)
-        ).where(Lecture.id == lecture_id)
+        lectures_with_details_query().where(Lecture.id == lecture_id)
     )
-    lecture = result_query.scalar_one_or_none()
+    lecture = result_query.unique().scalar_one_or_none()
     
     if not lecture:
         raise HTTPException(
@@ -138,54 +182,14 @@ async def get_lecture_by_id(
             detail=f"Lecture with id {lecture_id} not found"
         )
     
-    # Get student count
-    count_query = await db.execute(
-        select(func.count(func.distinct(SessionParticipation.student_id))).where(
-            SessionParticipation.lecture_id == lecture.id
-        )
-    )
-    student_count = count_query.scalar() or 0
-    
-    # Build teacher response
-    teachers_data = []
-    for teacher in lecture.teachers:
-        teachers_data.append(TeacherResponse(
-            teacher_id=teacher.id,
-            first_name=teacher.user.firstname if teacher.user else None,
-            last_name=teacher.user.lastname if teacher.user else None
-        ))
-    
-    # Build schedules response
-    schedules_data = []
-    for schedule in lecture.schedules:
-        schedules_data.append(WeeklyScheduleResponse(
-            weekly_schedule_id=schedule.id,
-            lecture_id=schedule.lecture_id,
-            day_of_week=schedule.day_of_week,
-            start_time=schedule.start_time,
-            end_time=schedule.end_time
-        ))
-    
-    return LectureResponse(
-        lecture_id=lecture.id,
-        lecture_name_ar=lecture.lecture_name_ar,
-        lecture_name_en=lecture.lecture_name_en,
-        circle_type=lecture.circle_type,
-        category=lecture.category,
-        shown_on_website=lecture.shown_on_website,
-        teachers=teachers_data,
-        schedules=schedules_data,
-        student_count=student_count,
-        created_at=lecture.created_at,
-        updated_at=lecture.updated_at
-    )
+    return map_lecture_to_response(lecture)
 
 
 @lectureRouter.post("/special/lectures/submit", response_model=LectureResponse, status_code=status.HTTP_201_CREATED)
 async def create_lecture(
     lecture_data: LectureCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """
     Create a new lecture with teachers and schedules
@@ -223,6 +227,7 @@ async def create_lecture(
         db.add(schedule)
     
     await db.commit()
+    await invalidate_namespace(LECTURE_CATALOGUE)
     await db.refresh(new_lecture)
     
     # Load relationships
@@ -234,38 +239,7 @@ async def create_lecture(
     )
     lecture = result_query.unique().scalar_one()
     
-    # Build response
-    teachers_data = []
-    for teacher in lecture.teachers:
-        teachers_data.append(TeacherResponse(
-            teacher_id=teacher.id,
-            first_name=teacher.user.firstname if teacher.user else None,
-            last_name=teacher.user.lastname if teacher.user else None
-        ))
-    
-    schedules_data = []
-    for schedule in lecture.schedules:
-        schedules_data.append(WeeklyScheduleResponse(
-            weekly_schedule_id=schedule.id,
-            lecture_id=schedule.lecture_id,
-            day_of_week=schedule.day_of_week,
-            start_time=schedule.start_time,
-            end_time=schedule.end_time
-        ))
-    
-    return LectureResponse(
-        lecture_id=lecture.id,
-        lecture_name_ar=lecture.lecture_name_ar,
-        lecture_name_en=lecture.lecture_name_en,
-        circle_type=lecture.circle_type,
-        category=lecture.category,
-        shown_on_website=lecture.shown_on_website,
-        teachers=teachers_data,
-        schedules=schedules_data,
-        student_count=0,
-        created_at=lecture.created_at,
-        updated_at=lecture.updated_at
-    )
+    return map_lecture_to_response(lecture)
 
 
 @lectureRouter.put("/special/lectures/{lecture_id}", response_model=LectureResponse)
@@ -273,7 +247,7 @@ async def update_lecture(
     lecture_id: int,
     lecture_data: LectureUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """
     Update an existing lecture
@@ -323,64 +297,23 @@ async def update_lecture(
         db.add(schedule)
     
     await db.commit()
+    await invalidate_namespace(LECTURE_CATALOGUE)
     await db.refresh(lecture)
     
     # Load relationships
     result_query = await db.execute(
-        select(Lecture).options(
-            joinedload(Lecture.teachers).joinedload(Teacher.user),
-            joinedload(Lecture.schedules)
-        ).where(Lecture.id == lecture_id)
+        lectures_with_details_query().where(Lecture.id == lecture_id)
     )
     lecture = result_query.unique().scalar_one()
     
-    # Get student count
-    count_query = await db.execute(
-        select(func.count(func.distinct(SessionParticipation.student_id))).where(
-            SessionParticipation.lecture_id == lecture.id
-        )
-    )
-    student_count = count_query.scalar() or 0
-    
-    # Build response
-    teachers_data = []
-    for teacher in lecture.teachers:
-        teachers_data.append(TeacherResponse(
-            teacher_id=teacher.id,
-            first_name=teacher.user.firstname if teacher.user else None,
-            last_name=teacher.user.lastname if teacher.user else None
-        ))
-    
-    schedules_data = []
-    for schedule in lecture.schedules:
-        schedules_data.append(WeeklyScheduleResponse(
-            weekly_schedule_id=schedule.id,
-            lecture_id=schedule.lecture_id,
-            day_of_week=schedule.day_of_week,
-            start_time=schedule.start_time,
-            end_time=schedule.end_time
-        ))
-    
-    return LectureResponse(
-        lecture_id=lecture.id,
-        lecture_name_ar=lecture.lecture_name_ar,
-        lecture_name_en=lecture.lecture_name_en,
-        circle_type=lecture.circle_type,
-        category=lecture.category,
-        shown_on_website=lecture.shown_on_website,
-        teachers=teachers_data,
-        schedules=schedules_data,
-        student_count=student_count,
-        created_at=lecture.created_at,
-        updated_at=lecture.updated_at
-    )
+    return map_lecture_to_response(lecture)
 
 
 @lectureRouter.delete("/{lecture_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_lecture(
     lecture_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """
     Delete a lecture by ID
@@ -396,6 +329,245 @@ async def delete_lecture(
     
     await db.delete(lecture)
     await db.commit()
+    await invalidate_namespace(LECTURE_CATALOGUE)
     
     return None
 
+
+# ==================== ATTENDANCE OPERATIONS ====================
+
+@lectureRouter.post("/{lecture_id}/attendance", response_model=AttendanceList)
+async def mark_lecture_attendance(
+    lecture_id: int,
+    attendance_data: LectureAttendanceBulk,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Create or update the attendance of several students of a lecture for one date.
+    All rows are written with a single upsert on (student_id, date).
+    """
+    result_query = await db.execute(select(Lecture.id).where(Lecture.id == lecture_id))
+    if result_query.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lecture with id {lecture_id} not found"
+        )
+
+    student_ids = [entry.student_id for entry in attendance_data.entries]
+    if len(set(student_ids)) != len(student_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each student may appear only once per request"
+        )
+
+    # Only students enrolled in this lecture can be marked
+    enrolled_query = await db.execute(
+        select(SessionParticipation.student_id)
+        .where(
+            SessionParticipation.lecture_id == lecture_id,
+            SessionParticipation.student_id.in_(student_ids)
+        )
+        .distinct()
+    )
+    not_enrolled = sorted(set(student_ids) - set(enrolled_query.scalars().all()))
+    if not_enrolled:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Students not enrolled in lecture {lecture_id}: {not_enrolled}"
+        )
+
+    attendances = await upsert_attendances(
+        db,
+        Attendance,
+        "student_id",
+        [
+            {
+                "student_id": entry.student_id,
+                "date": attendance_data.date,
+                "status": entry.status.value,
+                "notes": entry.notes,
+            }
+            for entry in attendance_data.entries
+        ]
+    )
+    await refresh_attendance_rollups(db, [(student_id, attendance_data.date) for student_id in student_ids])
+    await db.commit()
+
+    logger.info(
+        f"Attendance of {len(attendances)} student(s) saved for lecture {lecture_id} "
+        f"on {attendance_data.date} by user {current_user.id}"
+    )
+
+    return AttendanceList(attendances=attendances, total=len(attendances))
+
+
+@lectureRouter.get("/{lecture_id}/attendance/summary", response_model=AttendanceSummary)
+async def get_lecture_attendance_summary(
+    lecture_id: int,
+    period: str = Query("month", pattern="^(week|month)$"),
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Attendance counts per status for every week or month, over the students
+    currently enrolled in the lecture, optionally limited to a `from`/`to` range.
+    """
+    result_query = await db.execute(select(Lecture.id).where(Lecture.id == lecture_id))
+    if result_query.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lecture with id {lecture_id} not found"
+        )
+
+    enrolled_students = select(SessionParticipation.student_id).where(
+        SessionParticipation.lecture_id == lecture_id
+    )
+    filters = [
+        Attendance.student_id.in_(enrolled_students),
+        *day_filters(Attendance.date, date_from=date_from, date_to=date_to)
+    ]
+
+    buckets = await summarize_attendance(db, Attendance, filters, period)
+    return build_attendance_summary(period, buckets)
+
+
+# ==================== ACHIEVEMENT OPERATIONS ====================
+
+@lectureRouter.post("/{lecture_id}/achievements/bulk", response_model=AchievementList, status_code=status.HTTP_201_CREATED)
+async def add_lecture_achievements(
+    lecture_id: int,
+    achievement_data: LectureAchievementBulk,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_teacher_or_above)
+):
+    """
+    Record the achievements of several students of a lecture for one date.
+    Ranges are validated against the Quran metadata, all rows are inserted with one
+    statement, and the leaderboard rollup and memorization coverage are updated in
+    the same transaction. Teachers can only record for lectures they teach.
+    """
+    result_query = await db.execute(select(Lecture.id).where(Lecture.id == lecture_id))
+    if result_query.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lecture with id {lecture_id} not found"
+        )
+
+    if current_user.role == UserRoleEnum.TEACHER:
+        result_query = await db.execute(
+            select(lecture_teachers.c.lecture_id)
+            .join(Teacher, Teacher.id == lecture_teachers.c.teacher_id)
+            .where(lecture_teachers.c.lecture_id == lecture_id, Teacher.user_id == current_user.id)
+        )
+        if result_query.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Teachers can only record achievements for their own lectures"
+            )
+
+    student_ids = {entry.student_id for entry in achievement_data.entries}
+
+    # Only students enrolled in this lecture can be recorded
+    enrolled_query = await db.execute(
+        select(SessionParticipation.student_id)
+        .where(
+            SessionParticipation.lecture_id == lecture_id,
+            SessionParticipation.student_id.in_(student_ids)
+        )
+        .distinct()
+    )
+    not_enrolled = sorted(student_ids - set(enrolled_query.scalars().all()))
+    if not_enrolled:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Students not enrolled in lecture {lecture_id}: {not_enrolled}"
+        )
+
+    result_query = await db.scalars(
+        insert(Achievement).returning(Achievement),
+        [
+            {
+                "student_id": entry.student_id,
+                "from_surah": entry.from_surah,
+                "to_surah": entry.to_surah,
+                "from_verse": entry.from_verse,
+                "to_verse": entry.to_verse,
+                "note": entry.note,
+                "achievement_type": entry.achievement_type.value,
+                "date": achievement_data.date,
+            }
+            for entry in achievement_data.entries
+        ]
+    )
+    achievements = result_query.all()
+
+    await refresh_achievement_rollups(db, [(student_id, achievement_data.date) for student_id in student_ids])
+
+    ranges_by_student: dict[int, list[tuple[int, int]]] = {}
+    for entry in achievement_data.entries:
+        ranges_by_student.setdefault(entry.student_id, []).append(
+            range_indices(entry.from_surah, entry.from_verse, entry.to_surah, entry.to_verse)
+        )
+    # Coverage rows are locked in student order so concurrent requests cannot deadlock
+    for student_id in sorted(ranges_by_student):
+        await add_to_coverage(db, student_id, ranges_by_student[student_id])
+
+    await db.commit()
+
+    logger.info(
+        f"{len(achievements)} achievement(s) recorded for lecture {lecture_id} "
+        f"on {achievement_data.date} by user {current_user.id}"
+    )
+
+    return AchievementList(achievements=achievements, total=len(achievements))
+
+
+@lectureRouter.get("/{lecture_id}/achievements/coverage", response_model=LectureCoverageResponse)
+async def get_lecture_achievement_coverage(
+    lecture_id: int,
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Verses covered per achievement type for every student enrolled in the lecture,
+    computed from one achievements query ordered by student.
+    """
+    result_query = await db.execute(select(Lecture.id).where(Lecture.id == lecture_id))
+    if result_query.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Lecture with id {lecture_id} not found"
+        )
+
+    enrolled_query = await db.execute(
+        select(SessionParticipation.student_id)
+        .where(SessionParticipation.lecture_id == lecture_id)
+        .distinct()
+        .order_by(SessionParticipation.student_id)
+    )
+    student_ids = enrolled_query.scalars().all()
+
+    result_query = await db.execute(
+        achievement_coverage_query(
+            Achievement.student_id.in_(student_ids),
+            *day_filters(Achievement.date, date_from=date_from, date_to=date_to)
+        )
+    )
+    rows_by_student: dict[int, list] = {student_id: [] for student_id in student_ids}
+    for student_id, *row in result_query.all():
+        rows_by_student[student_id].append(row)
+
+    students = []
+    for student_id, rows in rows_by_student.items():
+        merged = merge_by_type(rows)
+        students.append(StudentCoverageSummary(
+            student_id=student_id,
+            **{name: covered_count(intervals) for name, intervals in merged.items()}
+        ))
+
+    return LectureCoverageResponse(lecture_id=lecture_id, students=students)
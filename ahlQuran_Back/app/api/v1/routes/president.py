@@ -14,6 +14,7 @@ from app.schemas.teacher import TeacherCreate, TeacherResponse
 from app.schemas.student import StudentCreate, StudentResponse
 from app.schemas.supervisor import SupervisorCreate, SupervisorResponse
 from app.core.dependencies import require_president
+from app.core.principals import Principal
 
 
 presidentRouter = APIRouter()
@@ -23,7 +24,7 @@ presidentRouter = APIRouter()
 async def add_supervisor(
         supervisor_data: SupervisorCreate,
         db: AsyncSession = Depends(get_db),
-        current_president: User = Depends(require_president),
+        current_president: Principal = Depends(require_president),
 ):
     # Check if email already exists
     existing_user = await db.execute(
@@ -62,7 +63,7 @@ async def add_supervisor(
 async def register_teacher(
     teacher_data: TeacherCreate,
     db: AsyncSession = Depends(get_db),
-    current_president: User = Depends(require_president)
+    current_president: Principal = Depends(require_president)
 ):
     # Check if email already exists
     existing_user = await db.execute(
@@ -109,7 +110,7 @@ async def register_teacher(
 async def register_student(
     student_data: StudentCreate,
     db: AsyncSession = Depends(get_db),
-    current_president: User = Depends(require_president)
+    current_president: Principal = Depends(require_president)
 ):
     # Check if email already exists
     existing_user = await db.execute(
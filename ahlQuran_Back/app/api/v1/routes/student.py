@@ -1,25 +1,65 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
+from typing import Optional, AsyncGenerator, Union
+import asyncio
+import csv
+import io
+import orjson
 
-from app.db.session import get_db
+from app.db.session import get_db, SessionLocal
 from app.models.user import User, UserRoleEnum
 from app.models.student import Student
 from app.models.acheivements import Achievement
 from app.models.attendance import Attendance
 from app.models.session import Session
 from app.models.sessionParticipation import SessionParticipation
+from app.models.lecture import Lecture
 from app.schemas.student import (
     StudentCreate, StudentUpdate, StudentResponse, StudentList,
+    StudentBulkImportResult, BulkImportRowError,
     PersonalInfo, AccountInfo, ContactInfo, GuardianInfo, 
     LectureInfo, FormalEducationInfo, MedicalInfo, SubscriptionInfo
 )
-from app.schemas.achievement import AchievementCreate, AchievementUpdate, AchievementResponse, AchievementList
-from app.schemas.attendance import AttendanceCreate, AttendanceUpdate, AttendanceResponse, AttendanceList
+from app.schemas.achievement import (
+    AchievementCreate, AchievementUpdate, AchievementResponse, AchievementList, Leaderboard, LeaderboardEntry,
+    AchievementType, ProgressPoint, ProgressTimeline
+)
+from app.schemas.attendance import (
+    AttendanceCreate, AttendanceUpdate, AttendanceResponse, AttendanceList, AttendanceSummary,
+    AttendanceRollupResponse, AttendanceRollupList, AttendanceCalendar
+)
 from app.schemas.student_full import StudentCreateFull
+from app.schemas.types import DayDate
+from app.quran import range_indices, surah_verse, covered_count, SURAHS, JUZ_OFFSETS, TOTAL_AYAHS, CoverageBitmap
+from app.schemas.coverage import (
+    CoverageSlice, MemorizationCoverageResponse, CoverageInterval, TypeCoverage, AchievementCoverageResponse
+)
+from app.services.coverage import (
+    add_to_coverage, recompute_coverage, merge_by_type, achievement_coverage_query
+)
+from app.models.memorization_coverage import MemorizationCoverage
 from app.core.dependencies import get_current_user, require_president_or_supervisor
-from app.core.security import get_password_hash
+from app.core.principals import Principal, invalidate_user_principal
+from app.services.enrollment import refresh_lecture_student_counts
+from app.services.attendance import (
+    summarize_attendance, build_attendance_summary, attendance_rate,
+    encode_attendance_calendar, CALENDAR_LEGEND
+)
+from app.services.attendance_rollup import refresh_attendance_rollups
+from app.services.achievement_rollup import refresh_achievement_rollups
+from app.services.progress import progress_timeline, downsample_timeline
+from app.models.achievement_rollup import AchievementMonthlyRollup
+from app.models.attendance_rollup import AttendanceMonthlyRollup
+from app.core.response_cache import LECTURE_CATALOGUE, invalidate_namespace
+from app.core.security import hash_password
+from app.core.pagination import decode_cursor, next_cursor_for, count_total
+from app.core.dates import filter_by_day, day_filters, parse_month
+from app.core.etag import STUDENT_LIST_TABLES, check_not_modified
 
 import logging
 logger = logging.getLogger(__name__)
@@ -129,11 +169,46 @@ def map_student_to_response(student: Student) -> StudentResponse:
     )
 
 
+def map_full_to_student_fields(student_data: StudentCreateFull) -> dict:
+    """Helper to map the nested StudentCreateFull payload to Student column values"""
+
+    # Construct parent name from guardian info
+    parent_name = f"{student_data.guardian.first_name or ''} {student_data.guardian.last_name or ''}".strip()
+
+    return dict(
+        parent_name=parent_name if parent_name else None,
+        parent_phone=student_data.contactInfo.phone_number,
+        guardian_email=student_data.guardian.email,
+        Golden=False,
+        
+        # New Fields Mapped from JSON
+        sex=student_data.personalInfo.sex,
+        date_of_birth=student_data.personalInfo.date_of_birth,
+        place_of_birth=student_data.personalInfo.place_of_birth,
+        home_address=student_data.personalInfo.home_address,
+        nationality=student_data.personalInfo.nationality,
+        
+        # English name fields
+        first_name_en=student_data.personalInfo.first_name_en,
+        last_name_en=student_data.personalInfo.last_name_en,
+        
+        # Parent status fields
+        father_status=student_data.personalInfo.father_status,
+        mother_status=student_data.personalInfo.mother_status,
+        
+        academic_level=student_data.formalEducationInfo.academic_level,
+        grade=student_data.formalEducationInfo.grade,
+        school_name=student_data.formalEducationInfo.school_name,
+        
+        guardian_id=student_data.guardian.guardian_id
+    )
+
+
 @studentRouter.post("/", response_model=StudentResponse, status_code=status.HTTP_201_CREATED)
 async def create_student(
     student_data: StudentCreateFull,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     # Check if email already exists
     result = await db.execute(
@@ -152,7 +227,7 @@ async def create_student(
         firstname=student_data.personalInfo.first_name_ar,
         lastname=student_data.personalInfo.last_name_ar,
         email=student_data.contactInfo.email,
-        hashed_password=get_password_hash(student_data.accountInfo.passcode),
+        hashed_password=await hash_password(student_data.accountInfo.passcode),
         role=UserRoleEnum.STUDENT,
         is_active=True
     )
@@ -161,37 +236,10 @@ async def create_student(
     await db.flush()
 
     # Create student record
-    # Construct parent name from guardian info
-    parent_name = f"{student_data.guardian.first_name or ''} {student_data.guardian.last_name or ''}".strip()
-    
     new_student = Student(
         user_id=new_user.id,
-        parent_name=parent_name if parent_name else None,
-        parent_phone=student_data.contactInfo.phone_number,
-        guardian_email=student_data.guardian.email,
         created_by_id=current_user.id,
-        Golden=False,
-        
-        # New Fields Mapped from JSON
-        sex=student_data.personalInfo.sex,
-        date_of_birth=student_data.personalInfo.date_of_birth,
-        place_of_birth=student_data.personalInfo.place_of_birth,
-        home_address=student_data.personalInfo.home_address,
-        nationality=student_data.personalInfo.nationality,
-        
-        # English name fields
-        first_name_en=student_data.personalInfo.first_name_en,
-        last_name_en=student_data.personalInfo.last_name_en,
-        
-        # Parent status fields
-        father_status=student_data.personalInfo.father_status,
-        mother_status=student_data.personalInfo.mother_status,
-        
-        academic_level=student_data.formalEducationInfo.academic_level,
-        grade=student_data.formalEducationInfo.grade,
-        school_name=student_data.formalEducationInfo.school_name,
-        
-        guardian_id=student_data.guardian.guardian_id
+        **map_full_to_student_fields(student_data)
     )
 
     db.add(new_student)
@@ -208,7 +256,13 @@ async def create_student(
             )
             db.add(participation)
 
+        # Keep lecture enrollment counters in the same transaction
+        await db.flush()
+        await refresh_lecture_student_counts(db, (l.lecture_id for l in student_data.lectures))
+
     await db.commit()
+    if student_data.lectures:
+        await invalidate_namespace(LECTURE_CATALOGUE)
     
     # Reload with relationships for response mapping
     result = await db.execute(
@@ -226,53 +280,483 @@ async def create_student(
     return map_student_to_response(loaded_student)
 
 
+BULK_IMPORT_MAX_ROWS = 2000
+
+# CSV header -> (StudentCreateFull section, field alias)
+BULK_CSV_COLUMNS = {
+    "firstNameAr": ("personalInfo", "firstNameAr"),
+    "lastNameAr": ("personalInfo", "lastNameAr"),
+    "firstNameEn": ("personalInfo", "firstNameEn"),
+    "lastNameEn": ("personalInfo", "lastNameEn"),
+    "sex": ("personalInfo", "sex"),
+    "dateOfBirth": ("personalInfo", "dateOfBirth"),
+    "placeOfBirth": ("personalInfo", "placeOfBirth"),
+    "homeAddress": ("personalInfo", "homeAddress"),
+    "nationality": ("personalInfo", "nationality"),
+    "fatherStatus": ("personalInfo", "fatherStatus"),
+    "motherStatus": ("personalInfo", "motherStatus"),
+    "username": ("accountInfo", "username"),
+    "passcode": ("accountInfo", "passcode"),
+    "phoneNumber": ("contactInfo", "phoneNumber"),
+    "email": ("contactInfo", "email"),
+    "guardianId": ("guardian", "guardianId"),
+    "guardianFirstName": ("guardian", "firstName"),
+    "guardianLastName": ("guardian", "lastName"),
+    "guardianEmail": ("guardian", "email"),
+    "guardianRelationship": ("guardian", "relationship"),
+    "academicLevel": ("formalEducationInfo", "academicLevel"),
+    "grade": ("formalEducationInfo", "grade"),
+    "schoolName": ("formalEducationInfo", "schoolName"),
+}
+
+
+def csv_row_to_payload(row: dict) -> dict:
+    """Helper to turn a flat CSV row into the nested StudentCreateFull shape"""
+    payload = {
+        "personalInfo": {},
+        "accountInfo": {},
+        "contactInfo": {},
+        "guardian": {},
+        "formalEducationInfo": {},
+        "lectures": [],
+    }
+
+    for column, value in row.items():
+        # Skip cells without a header and empty cells
+        if column is None or not isinstance(value, str) or not value.strip():
+            continue
+        value = value.strip()
+
+        if column == "lectureIds":
+            payload["lectures"] = [
+                {"lectureId": lecture_id.strip()}
+                for lecture_id in value.split(";") if lecture_id.strip()
+            ]
+        elif column in BULK_CSV_COLUMNS:
+            section, field = BULK_CSV_COLUMNS[column]
+            payload[section][field] = value
+
+    return payload
+
+
+async def parse_bulk_upload(file: UploadFile) -> list:
+    """Read an uploaded .csv or .json file into a list of StudentCreateFull-shaped dicts"""
+    content = await file.read()
+    filename = (file.filename or "").lower()
+
+    try:
+        if filename.endswith(".json") or file.content_type == "application/json":
+            rows = orjson.loads(content)
+            if not isinstance(rows, list):
+                raise ValueError("JSON upload must be a list of students")
+            return rows
+
+        if filename.endswith(".csv") or file.content_type == "text/csv":
+            reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
+            return [csv_row_to_payload(row) for row in reader]
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Could not parse upload: {e}"
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Unsupported file type, upload a .csv or .json file"
+    )
+
+
+@studentRouter.post("/bulk", response_model=StudentBulkImportResult)
+async def bulk_import_students(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Register many students from a CSV or JSON upload.
+
+    JSON uploads are a list of objects shaped like the POST / body. CSV uploads use the
+    column names of BULK_CSV_COLUMNS plus `lectureIds` (ids separated by `;`).
+    Valid rows are inserted in batched statements; invalid rows are reported per row.
+    """
+
+    raw_rows = await parse_bulk_upload(file)
+
+    if len(raw_rows) > BULK_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload contains {len(raw_rows)} rows, the maximum is {BULK_IMPORT_MAX_ROWS}"
+        )
+
+    errors = []
+    valid_rows = []  # (row number, StudentCreateFull)
+    seen_emails = set()
+
+    # Validate every row against the same schema as POST /
+    for row_number, raw in enumerate(raw_rows, start=1):
+        try:
+            student_data = StudentCreateFull.model_validate(raw)
+        except ValidationError as e:
+            contact = raw.get("contactInfo") if isinstance(raw, dict) else None
+            errors.append(BulkImportRowError(
+                row=row_number,
+                email=contact.get("email") if isinstance(contact, dict) else None,
+                errors=[f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()]
+            ))
+            continue
+
+        email = student_data.contactInfo.email
+        if not email:
+            errors.append(BulkImportRowError(row=row_number, errors=["contactInfo.email: Email is required"]))
+        elif email in seen_emails:
+            errors.append(BulkImportRowError(row=row_number, email=email, errors=["Email appears more than once in the upload"]))
+        else:
+            seen_emails.add(email)
+            valid_rows.append((row_number, student_data))
+
+    # Check email uniqueness and lecture ids with one query each
+    if valid_rows:
+        existing_result = await db.execute(
+            select(User.email).where(User.email.in_(seen_emails))
+        )
+        existing_emails = set(existing_result.scalars().all())
+
+        lecture_ids = {lecture.lecture_id for _, data in valid_rows for lecture in data.lectures}
+        known_lecture_ids = set()
+        if lecture_ids:
+            lecture_result = await db.execute(
+                select(Lecture.id).where(Lecture.id.in_(lecture_ids))
+            )
+            known_lecture_ids = set(lecture_result.scalars().all())
+
+        checked_rows = []
+        for row_number, data in valid_rows:
+            row_errors = []
+            if data.contactInfo.email in existing_emails:
+                row_errors.append("Email already registered")
+            unknown = sorted({l.lecture_id for l in data.lectures} - known_lecture_ids)
+            if unknown:
+                row_errors.append(f"Unknown lecture id(s): {', '.join(map(str, unknown))}")
+
+            if row_errors:
+                errors.append(BulkImportRowError(row=row_number, email=data.contactInfo.email, errors=row_errors))
+            else:
+                checked_rows.append((row_number, data))
+        valid_rows = checked_rows
+
+    student_ids = []
+    if valid_rows:
+        # Hash all passcodes concurrently on the hashing pool
+        hashed_passwords = await asyncio.gather(
+            *(hash_password(data.accountInfo.passcode) for _, data in valid_rows)
+        )
+
+        try:
+            # Insert users, students and participations as three batched statements
+            user_result = await db.execute(
+                insert(User).returning(User.id, sort_by_parameter_order=True),
+                [
+                    dict(
+                        firstname=data.personalInfo.first_name_ar,
+                        lastname=data.personalInfo.last_name_ar,
+                        email=data.contactInfo.email,
+                        hashed_password=hashed_password,
+                        role=UserRoleEnum.STUDENT,
+                        is_active=True
+                    )
+                    for (_, data), hashed_password in zip(valid_rows, hashed_passwords)
+                ]
+            )
+            user_ids = user_result.scalars().all()
+
+            student_result = await db.execute(
+                insert(Student).returning(Student.id, sort_by_parameter_order=True),
+                [
+                    dict(
+                        user_id=user_id,
+                        created_by_id=current_user.id,
+                        **map_full_to_student_fields(data)
+                    )
+                    for user_id, (_, data) in zip(user_ids, valid_rows)
+                ]
+            )
+            student_ids = student_result.scalars().all()
+
+            participation_rows = [
+                dict(student_id=student_id, session_id=None, lecture_id=lecture_id)
+                for student_id, (_, data) in zip(student_ids, valid_rows)
+                for lecture_id in dict.fromkeys(l.lecture_id for l in data.lectures)
+            ]
+            if participation_rows:
+                await db.execute(insert(SessionParticipation), participation_rows)
+                await refresh_lecture_student_counts(db, (row["lecture_id"] for row in participation_rows))
+
+            await db.commit()
+            if participation_rows:
+                await invalidate_namespace(LECTURE_CATALOGUE)
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Import conflicted with concurrent changes, no students were created"
+            )
+
+    logger.info(f"Bulk import: {len(student_ids)} students created, {len(errors)} rows rejected by user {current_user.id}")
+
+    return StudentBulkImportResult(
+        created=len(student_ids),
+        failed=len(errors),
+        student_ids=list(student_ids),
+        errors=sorted(errors, key=lambda e: e.row)
+    )
+
+
 @studentRouter.get("/", response_model=StudentList)
 async def list_students(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     lecture_id: int = None,
+    cursor: Optional[str] = None,
+    estimate_total: bool = False,
     db: AsyncSession = Depends(get_db),
-    # current_user: User = Depends(require_president_or_supervisor)
+    # current_user: Principal = Depends(require_president_or_supervisor)
 ):
-    """Get all students. Optionally filter by lecture_id. Only presidents and supervisors can view all students."""
+    """
+    Get all students. Optionally filter by lecture_id. Only presidents and supervisors can view all students.
 
-    # Build query with optional lecture filter
-    query = select(Student).options(
-        selectinload(Student.user),
-        selectinload(Student.participations).selectinload(SessionParticipation.lecture)
-    )
+    Students are ordered by id. Pass the returned next_cursor as `cursor` to fetch the
+    following page with a keyset seek instead of an offset; `skip` is ignored in that mode.
+    With `estimate_total` and no lecture filter, `total` is the planner's row estimate.
+    Answers 304 Not Modified when If-None-Match carries the current ETag.
+    """
+
+    not_modified = await check_not_modified(db, request, response, STUDENT_LIST_TABLES)
+    if not_modified is not None:
+        return not_modified
+
+    # Build filter with optional lecture filter
+    filtered = select(Student)
     
     # If lecture_id is provided, filter students by lecture
     if lecture_id is not None:
-        query = query.join(Student.participations).where(
+        filtered = filtered.join(Student.participations).where(
             SessionParticipation.lecture_id == lecture_id
-        ).distinct()
+        )
+
+    query = filtered.options(
+        selectinload(Student.user),
+        selectinload(Student.participations).selectinload(SessionParticipation.lecture)
+    )
+    if lecture_id is not None:
+        query = query.distinct()
     
-    query = query.offset(skip).limit(limit)
+    if cursor is not None:
+        query = query.where(Student.id > decode_cursor(cursor))
+    else:
+        query = query.offset(skip)
+
+    query = query.order_by(Student.id).limit(limit)
     
     result = await db.execute(query)
     students = result.scalars().unique().all()
 
     # Get total count with same filter
-    count_query = select(Student)
-    if lecture_id is not None:
-        count_query = count_query.join(Student.participations).where(
-            SessionParticipation.lecture_id == lecture_id
-        ).distinct()
-    
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().unique().all())
+    total = await count_total(
+        db,
+        filtered,
+        distinct_column=Student.id if lecture_id is not None else None,
+        cache_key=f"students:lecture={lecture_id}",
+        estimate_table=Student.__tablename__ if estimate_total and lecture_id is None else None
+    )
 
     student_responses = [map_student_to_response(student) for student in students]
 
-    return StudentList(students=student_responses, total=total)
+    return StudentList(
+        students=student_responses,
+        total=total,
+        next_cursor=next_cursor_for(students, limit)
+    )
+
+
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_COLUMNS = [
+    Student.id.label("id"),
+    User.id.label("user_id"),
+    User.firstname.label("firstname"),
+    User.lastname.label("lastname"),
+    Student.first_name_en.label("first_name_en"),
+    Student.last_name_en.label("last_name_en"),
+    User.email.label("email"),
+    Student.sex.label("sex"),
+    Student.date_of_birth.label("date_of_birth"),
+    Student.place_of_birth.label("place_of_birth"),
+    Student.home_address.label("home_address"),
+    Student.nationality.label("nationality"),
+    Student.father_status.label("father_status"),
+    Student.mother_status.label("mother_status"),
+    Student.parent_name.label("parent_name"),
+    Student.parent_phone.label("parent_phone"),
+    Student.guardian_email.label("guardian_email"),
+    Student.guardian_id.label("guardian_id"),
+    Student.academic_level.label("academic_level"),
+    Student.grade.label("grade"),
+    Student.school_name.label("school_name"),
+    Student.enrollment_date.label("enrollment_date"),
+    Student.Golden.label("golden"),
+    User.is_active.label("is_active"),
+]
+
+
+def build_export_query(lecture_id: Optional[int]):
+    """Flat roster query: one row per student with lecture names folded into a single column"""
+    lectures_subquery = (
+        select(func.string_agg(Lecture.lecture_name_ar, "; "))
+        .select_from(SessionParticipation)
+        .join(Lecture, Lecture.id == SessionParticipation.lecture_id)
+        .where(SessionParticipation.student_id == Student.id)
+        .correlate(Student)
+        .scalar_subquery()
+    )
+
+    query = (
+        select(*EXPORT_COLUMNS, lectures_subquery.label("lectures"))
+        .join(User, User.id == Student.user_id)
+        .order_by(Student.id)
+    )
+
+    if lecture_id is not None:
+        query = query.where(
+            Student.id.in_(
+                select(SessionParticipation.student_id).where(
+                    SessionParticipation.lecture_id == lecture_id
+                )
+            )
+        )
+
+    return query
+
+
+async def stream_roster(query, export_format: str) -> AsyncGenerator[bytes, None]:
+    """
+    Stream the roster from a server-side cursor in batches. Uses its own session because
+    the request-scoped one is closed before the response body is sent.
+    """
+    async with SessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(result.keys())
+            yield buffer.getvalue().encode("utf-8")
+            async for partition in result.partitions(EXPORT_BATCH_SIZE):
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(partition)
+                yield buffer.getvalue().encode("utf-8")
+        else:
+            async for partition in result.mappings().partitions(EXPORT_BATCH_SIZE):
+                yield b"".join(
+                    orjson.dumps(dict(row), option=orjson.OPT_APPEND_NEWLINE) for row in partition
+                )
+
+
+@studentRouter.get("/export")
+async def export_students(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    lecture_id: int = None,
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """Export the full student roster as CSV or NDJSON, streamed so memory stays flat."""
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"students.{format}"
+
+    logger.info(f"Student roster export ({format}) requested by user {current_user.id}")
+
+    return StreamingResponse(
+        stream_roster(build_export_query(lecture_id), format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@studentRouter.get("/leaderboard", response_model=Leaderboard)
+async def get_leaderboard(
+    month_from: str = Query(..., alias="from", description="First month in MM-YYYY format", example="09-2024"),
+    month_to: Optional[str] = Query(None, alias="to", description="Last month in MM-YYYY format, defaults to `from`"),
+    rank_by: str = Query("new", pattern="^(new|revised)$"),
+    lecture_id: Optional[int] = None,
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Top students by verses memorized (`rank_by=new`) or revised (`rank_by=revised`)
+    over a range of months, school-wide or for the students of a lecture. Served from
+    the monthly achievement rollup.
+
+    Each figure is the sum of the distinct verses of every month: exact for a single
+    month, while a verse recorded again in another month of the range counts again.
+    Use /{student_id}/achievements/coverage for distinct verses over any period.
+    """
+    first_month, _ = parse_month(month_from)
+    last_month = parse_month(month_to)[0] if month_to else first_month
+    if last_month < first_month:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="`from` must not be after `to`"
+        )
+
+    verses_new = func.sum(AchievementMonthlyRollup.verses_new).label("verses_new")
+    verses_revised = func.sum(AchievementMonthlyRollup.verses_revised).label("verses_revised")
+    score = verses_new if rank_by == "new" else verses_revised
+
+    ranked = (
+        select(
+            AchievementMonthlyRollup.student_id,
+            verses_new,
+            verses_revised,
+            func.rank().over(order_by=score.desc()).label("rank")
+        )
+        .where(AchievementMonthlyRollup.month.between(first_month, last_month))
+        .group_by(AchievementMonthlyRollup.student_id)
+        .having(score > 0)
+        .order_by(score.desc(), AchievementMonthlyRollup.student_id)
+        .limit(limit)
+    )
+    if lecture_id is not None:
+        ranked = ranked.where(
+            AchievementMonthlyRollup.student_id.in_(
+                select(SessionParticipation.student_id).where(SessionParticipation.lecture_id == lecture_id)
+            )
+        )
+    ranked = ranked.subquery()
+
+    result = await db.execute(
+        select(ranked, User.firstname, User.lastname)
+        .join(Student, Student.id == ranked.c.student_id)
+        .join(User, User.id == Student.user_id)
+        .order_by(ranked.c.rank, ranked.c.student_id)
+    )
+
+    return Leaderboard(
+        month_from=first_month,
+        month_to=last_month,
+        rank_by=rank_by,
+        lecture_id=lecture_id,
+        entries=[LeaderboardEntry(**row) for row in result.mappings().all()]
+    )
 
 
 @studentRouter.get("/{student_id}", response_model=StudentResponse)
 async def get_student(
     student_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Get a specific student by ID."""
 
@@ -300,7 +784,7 @@ async def update_student(
     student_id: int,
     student_data: StudentUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Update student information. Only presidents and supervisors can update students."""
 
@@ -352,6 +836,7 @@ async def update_student(
     await db.commit()
     await db.refresh(student)
     await db.refresh(student.user)
+    invalidate_user_principal(student.user_id)
     # Refresh participations if needed, but they are not updated here
 
     logger.info(f"Student {student_id} updated by user {current_user.id}")
@@ -364,7 +849,7 @@ async def update_student_full(
     student_id: int,
     student_data: StudentCreateFull,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """
     Update complete student information with nested structure.
@@ -409,7 +894,7 @@ async def update_student_full(
     
     # Update password only if provided and different
     if student_data.accountInfo.passcode:
-        student.user.hashed_password = get_password_hash(student_data.accountInfo.passcode)
+        student.user.hashed_password = await hash_password(student_data.accountInfo.passcode)
 
     # Update Student fields - Personal Info
     student.sex = student_data.personalInfo.sex
@@ -441,6 +926,10 @@ async def update_student_full(
     student.school_name = student_data.formalEducationInfo.school_name
 
     # Update Lectures (Session Participations)
+    # Lectures whose enrollment counters may change
+    affected_lecture_ids = {p.lecture_id for p in student.participations}
+    affected_lecture_ids.update(l.lecture_id for l in student_data.lectures)
+
     # Remove existing participations
     await db.execute(
         SessionParticipation.__table__.delete().where(
@@ -458,7 +947,13 @@ async def update_student_full(
             )
             db.add(participation)
 
+    await db.flush()
+    await refresh_lecture_student_counts(db, affected_lecture_ids)
+
     await db.commit()
+    invalidate_user_principal(student.user_id)
+    if affected_lecture_ids:
+        await invalidate_namespace(LECTURE_CATALOGUE)
     
     # Reload with relationships for response
     result = await db.execute(
@@ -480,7 +975,7 @@ async def update_student_full(
 async def delete_student(
     student_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Delete a student. Only presidents and supervisors can delete students."""
 
@@ -495,9 +990,20 @@ async def delete_student(
             detail=f"Student with ID {student_id} not found"
         )
 
+    # Lectures whose enrollment counters drop with this student
+    lecture_ids_result = await db.execute(
+        select(SessionParticipation.lecture_id).where(SessionParticipation.student_id == student_id)
+    )
+    affected_lecture_ids = set(lecture_ids_result.scalars().all())
+
     # Delete the student (will cascade to user due to relationship)
     await db.delete(student)
+    await db.flush()
+    await refresh_lecture_student_counts(db, affected_lecture_ids)
     await db.commit()
+    invalidate_user_principal(student.user_id)
+    if affected_lecture_ids:
+        await invalidate_namespace(LECTURE_CATALOGUE)
 
     logger.info(f"Student {student_id} deleted by user {current_user.id}")
 
@@ -511,7 +1017,7 @@ async def add_achievement(
     student_id: int,
     achievement_data: AchievementCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Add an achievement/progress record for a student."""
 
@@ -547,6 +1053,14 @@ async def add_achievement(
     )
 
     db.add(new_achievement)
+    await db.flush()
+    await refresh_achievement_rollups(db, [(student_id, achievement_data.date)])
+    await add_to_coverage(db, student_id, [
+        range_indices(
+            achievement_data.from_surah, achievement_data.from_verse,
+            achievement_data.to_surah, achievement_data.to_verse
+        )
+    ])
     await db.commit()
     await db.refresh(new_achievement)
 
@@ -560,11 +1074,16 @@ async def get_student_achievements(
     student_id: int,
     skip: int = 0,
     limit: int = 100,
-    date: str = None,
+    date: Optional[DayDate] = None,
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
-    """Get all achievements for a specific student, optionally filtered by date."""
+    """
+    Get all achievements for a specific student, newest first, optionally filtered
+    by date or by an inclusive `from`/`to` date range.
+    """
 
     # Verify student exists
     result = await db.execute(
@@ -578,39 +1097,193 @@ async def get_student_achievements(
             detail=f"Student with ID {student_id} not found"
         )
 
-    # Build query with optional date filter
+    # Build query with optional date filters
     query = select(Achievement).where(Achievement.student_id == student_id)
-    
-    if date:
-        query = query.where(Achievement.date == date)
+    query = filter_by_day(query, Achievement.date, date, date_from, date_to)
     
     # Get achievements
     achievements_result = await db.execute(
         query
         .offset(skip)
         .limit(limit)
-        .order_by(Achievement.created_at.desc())
+        .order_by(Achievement.date.desc(), Achievement.created_at.desc())
     )
     achievements = achievements_result.scalars().all()
 
     # Get total count with same filter
-    count_query = select(Achievement).where(Achievement.student_id == student_id)
-    if date:
-        count_query = count_query.where(Achievement.date == date)
-    
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    total = await count_total(db, query)
 
     return AchievementList(achievements=list(achievements), total=total)
 
 
+def map_intervals_to_coverage(intervals: list[tuple[int, int]]) -> TypeCoverage:
+    """Helper to map merged global index intervals to TypeCoverage"""
+    responses = []
+    for start, end in intervals:
+        from_surah, from_verse = surah_verse(start)
+        to_surah, to_verse = surah_verse(end)
+        responses.append(CoverageInterval(
+            start=start,
+            end=end,
+            from_surah=from_surah,
+            from_verse=from_verse,
+            to_surah=to_surah,
+            to_verse=to_verse,
+            verse_count=end - start + 1
+        ))
+    return TypeCoverage(verse_count=covered_count(intervals), intervals=responses)
+
+
+@studentRouter.get("/{student_id}/achievements/coverage", response_model=AchievementCoverageResponse)
+async def get_achievement_coverage(
+    student_id: int,
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Merge a student's achievements into disjoint verse intervals for each achievement
+    type and for all types combined, optionally limited to a `from`/`to` date range.
+    """
+
+    # Verify student exists
+    result = await db.execute(
+        select(Student.id).where(Student.id == student_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with ID {student_id} not found"
+        )
+
+    result = await db.execute(
+        achievement_coverage_query(
+            Achievement.student_id == student_id,
+            *day_filters(Achievement.date, date_from=date_from, date_to=date_to)
+        )
+    )
+    merged = merge_by_type(row[1:] for row in result.all())
+
+    return AchievementCoverageResponse(
+        student_id=student_id,
+        **{name: map_intervals_to_coverage(intervals) for name, intervals in merged.items()}
+    )
+
+
+def coverage_percentage(memorized: int, total: int) -> float:
+    return round(memorized * 100 / total, 2) if total else 0.0
+
+
+@studentRouter.get("/{student_id}/coverage", response_model=MemorizationCoverageResponse)
+async def get_memorization_coverage(
+    student_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    How much of the Quran a student's achievements cover: memorized verse count and
+    percentage overall, per surah and per juz, read from the coverage bitmap.
+    """
+
+    # Verify student exists
+    result = await db.execute(
+        select(Student.id).where(Student.id == student_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with ID {student_id} not found"
+        )
+
+    result = await db.execute(
+        select(MemorizationCoverage.bitmap).where(MemorizationCoverage.student_id == student_id)
+    )
+    bitmap = CoverageBitmap.from_bytes(result.scalar_one_or_none())
+
+    surahs = [
+        CoverageSlice(
+            number=surah.number,
+            name=surah.english_name,
+            memorized=memorized,
+            total=surah.ayah_count,
+            percentage=coverage_percentage(memorized, surah.ayah_count)
+        )
+        for surah, memorized in zip(SURAHS, bitmap.per_surah())
+    ]
+    juz = []
+    for number, memorized in enumerate(bitmap.per_juz(), start=1):
+        total = JUZ_OFFSETS[number + 1] - JUZ_OFFSETS[number]
+        juz.append(CoverageSlice(
+            number=number,
+            memorized=memorized,
+            total=total,
+            percentage=coverage_percentage(memorized, total)
+        ))
+
+    memorized_verses = bitmap.count()
+    return MemorizationCoverageResponse(
+        student_id=student_id,
+        memorized_verses=memorized_verses,
+        total_verses=TOTAL_AYAHS,
+        percentage=coverage_percentage(memorized_verses, TOTAL_AYAHS),
+        surahs=surahs,
+        juz=juz
+    )
+
+
+@studentRouter.get("/{student_id}/progress/timeline", response_model=ProgressTimeline)
+async def get_progress_timeline(
+    student_id: int,
+    bucket: str = Query("month", pattern="^(week|month)$"),
+    achievement_type: Optional[AchievementType] = None,
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
+    max_points: int = Query(300, ge=10, le=1000),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Verses recorded per week or month, the verses covered for the first time and the
+    running total of distinct verses covered, for progress charts. Over every
+    achievement type (the default) the running total matches /coverage. Long
+    histories are downsampled to at most `max_points` points by merging consecutive
+    buckets.
+    """
+
+    # Verify student exists
+    result = await db.execute(
+        select(Student.id).where(Student.id == student_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with ID {student_id} not found"
+        )
+
+    points = await progress_timeline(
+        db, student_id, bucket,
+        achievement_type.value if achievement_type else None,
+        date_from=date_from, date_to=date_to
+    )
+    points, factor = downsample_timeline(points, max_points)
+
+    return ProgressTimeline(
+        student_id=student_id,
+        bucket=bucket,
+        achievement_type=achievement_type,
+        downsampled_by=factor,
+        points=[ProgressPoint(**point) for point in points]
+    )
+
+
 @studentRouter.put("/{student_id}/achievements/{achievement_id}", response_model=AchievementResponse)
 async def update_achievement(
     student_id: int,
     achievement_id: int,
     achievement_data: AchievementUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Update an achievement record."""
 
@@ -628,11 +1301,25 @@ async def update_achievement(
             detail=f"Achievement with ID {achievement_id} not found for student {student_id}"
         )
 
+    previous_date = achievement.date
+
     # Update fields
     update_data = achievement_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(achievement, field, value)
 
+    # The merged range must still exist in the Quran
+    try:
+        range_indices(achievement.from_surah, achievement.from_verse, achievement.to_surah, achievement.to_verse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    await db.flush()
+    await refresh_achievement_rollups(db, [(student_id, previous_date), (student_id, achievement.date)])
+    await recompute_coverage(db, student_id)
     await db.commit()
     await db.refresh(achievement)
 
@@ -646,7 +1333,7 @@ async def delete_achievement(
     student_id: int,
     achievement_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Delete an achievement record."""
 
@@ -664,7 +1351,11 @@ async def delete_achievement(
             detail=f"Achievement with ID {achievement_id} not found for student {student_id}"
         )
 
+    achievement_day = achievement.date
     await db.delete(achievement)
+    await db.flush()
+    await refresh_achievement_rollups(db, [(student_id, achievement_day)])
+    await recompute_coverage(db, student_id)
     await db.commit()
 
     logger.info(f"Achievement {achievement_id} deleted by user {current_user.id}")
@@ -680,7 +1371,7 @@ async def create_attendance(
     student_id: int,
     attendance_data: AttendanceCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Create or update attendance record for a student on a specific date."""
 
@@ -716,6 +1407,8 @@ async def create_attendance(
         # Update existing attendance
         existing_attendance.status = attendance_data.status
         existing_attendance.notes = attendance_data.notes
+        await db.flush()
+        await refresh_attendance_rollups(db, [(student_id, attendance_data.date)])
         await db.commit()
         await db.refresh(existing_attendance)
         logger.info(f"Attendance updated for student {student_id} on {attendance_data.date} by user {current_user.id}")
@@ -730,6 +1423,8 @@ async def create_attendance(
     )
 
     db.add(new_attendance)
+    await db.flush()
+    await refresh_attendance_rollups(db, [(student_id, attendance_data.date)])
     await db.commit()
     await db.refresh(new_attendance)
 
@@ -738,16 +1433,157 @@ async def create_attendance(
     return new_attendance
 
 
-@studentRouter.get("/{student_id}/attendance", response_model=AttendanceList)
+def map_rollup_to_response(rollup: AttendanceMonthlyRollup) -> AttendanceRollupResponse:
+    """Helper to map an AttendanceMonthlyRollup row to AttendanceRollupResponse"""
+    return AttendanceRollupResponse(
+        student_id=rollup.student_id,
+        month=rollup.month,
+        present=rollup.present,
+        late=rollup.late,
+        absent=rollup.absent,
+        excused=rollup.excused,
+        total=rollup.total,
+        attendance_rate=attendance_rate({
+            "present": rollup.present,
+            "late": rollup.late,
+            "total": rollup.total
+        })
+    )
+
+
+@studentRouter.get("/attendance/monthly", response_model=AttendanceRollupList)
+async def get_monthly_attendance(
+    month: str = Query(..., description="Month in MM-YYYY format", example="12-2024"),
+    lecture_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Attendance counters of every student for one month, served from the monthly
+    rollup. Optionally restricted to the students of a lecture. Students without
+    any attendance that month are not listed.
+    """
+    first_day, _ = parse_month(month)
+
+    query = select(AttendanceMonthlyRollup).where(AttendanceMonthlyRollup.month == first_day)
+    if lecture_id is not None:
+        query = query.where(
+            AttendanceMonthlyRollup.student_id.in_(
+                select(SessionParticipation.student_id).where(SessionParticipation.lecture_id == lecture_id)
+            )
+        )
+
+    result = await db.execute(
+        query.order_by(AttendanceMonthlyRollup.student_id).offset(skip).limit(limit)
+    )
+    rollups = result.scalars().all()
+
+    total = await count_total(db, query)
+
+    return AttendanceRollupList(
+        rollups=[map_rollup_to_response(rollup) for rollup in rollups],
+        total=total
+    )
+
+
+@studentRouter.get("/{student_id}/attendance/monthly", response_model=AttendanceRollupList)
+async def get_student_monthly_attendance(
+    student_id: int,
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Monthly attendance counters of a student, oldest first, served from the rollup.
+    `from`/`to` select the months containing those dates.
+    """
+
+    # Verify student exists
+    result = await db.execute(
+        select(Student.id).where(Student.id == student_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with ID {student_id} not found"
+        )
+
+    result = await db.execute(
+        select(AttendanceMonthlyRollup)
+        .where(
+            AttendanceMonthlyRollup.student_id == student_id,
+            *day_filters(
+                AttendanceMonthlyRollup.month,
+                date_from=date_from.replace(day=1) if date_from else None,
+                date_to=date_to
+            )
+        )
+        .order_by(AttendanceMonthlyRollup.month)
+    )
+    rollups = result.scalars().all()
+
+    return AttendanceRollupList(
+        rollups=[map_rollup_to_response(rollup) for rollup in rollups],
+        total=len(rollups)
+    )
+
+
+@studentRouter.get("/{student_id}/attendance/summary", response_model=AttendanceSummary)
+async def get_student_attendance_summary(
+    student_id: int,
+    period: str = Query("month", pattern="^(week|month)$"),
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Attendance counts per status for every week or month of a student's history,
+    optionally limited to an inclusive `from`/`to` date range.
+    """
+
+    # Verify student exists
+    result = await db.execute(
+        select(Student.id).where(Student.id == student_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with ID {student_id} not found"
+        )
+
+    filters = [
+        Attendance.student_id == student_id,
+        *day_filters(Attendance.date, date_from=date_from, date_to=date_to)
+    ]
+
+    buckets = await summarize_attendance(db, Attendance, filters, period)
+    return build_attendance_summary(period, buckets)
+
+
+@studentRouter.get("/{student_id}/attendance", response_model=Union[AttendanceList, AttendanceCalendar])
 async def get_student_attendance(
     student_id: int,
-    date: str = None,
+    date: Optional[DayDate] = None,
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
     skip: int = 0,
     limit: int = 100,
+    format: str = Query("list", pattern="^(list|calendar)$"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
-    """Get attendance records for a specific student. Optionally filter by date."""
+    """
+    Get attendance records for a specific student, newest first. Optionally filter
+    by date or by an inclusive `from`/`to` date range.
+
+    With `format=calendar` the whole matching history is returned instead as one
+    packed string per month (one status code per day, notes omitted);
+    `skip` and `limit` are ignored in that mode.
+    """
 
     # Verify student exists
     result = await db.execute(
@@ -761,26 +1597,31 @@ async def get_student_attendance(
             detail=f"Student with ID {student_id} not found"
         )
 
+    if format == "calendar":
+        calendar_result = await db.execute(
+            filter_by_day(
+                select(Attendance.date, Attendance.status).where(Attendance.student_id == student_id),
+                Attendance.date, date, date_from, date_to
+            ).order_by(Attendance.date)
+        )
+        return AttendanceCalendar(
+            student_id=student_id,
+            legend=CALENDAR_LEGEND,
+            months=encode_attendance_calendar(calendar_result.all())
+        )
+
     # Build query
     query = select(Attendance).where(Attendance.student_id == student_id)
+    query = filter_by_day(query, Attendance.date, date, date_from, date_to)
     
-    # Filter by date if provided
-    if date:
-        query = query.where(Attendance.date == date)
-    
-    query = query.order_by(Attendance.created_at.desc()).offset(skip).limit(limit)
-
     # Get attendance records
-    attendance_result = await db.execute(query)
+    attendance_result = await db.execute(
+        query.order_by(Attendance.date.desc()).offset(skip).limit(limit)
+    )
     attendances = attendance_result.scalars().all()
 
     # Get total count
-    count_query = select(Attendance).where(Attendance.student_id == student_id)
-    if date:
-        count_query = count_query.where(Attendance.date == date)
-    
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    total = await count_total(db, query)
 
     return AttendanceList(attendances=list(attendances), total=total)
 
@@ -791,7 +1632,7 @@ async def update_attendance(
     attendance_id: int,
     attendance_data: AttendanceUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Update an attendance record."""
 
@@ -814,6 +1655,8 @@ async def update_attendance(
     for field, value in update_data.items():
         setattr(attendance, field, value)
 
+    await db.flush()
+    await refresh_attendance_rollups(db, [(student_id, attendance.date)])
     await db.commit()
     await db.refresh(attendance)
 
@@ -827,7 +1670,7 @@ async def delete_attendance(
     student_id: int,
     attendance_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Delete an attendance record."""
 
@@ -845,7 +1688,10 @@ async def delete_attendance(
             detail=f"Attendance with ID {attendance_id} not found for student {student_id}"
         )
 
+    attendance_day = attendance.date
     await db.delete(attendance)
+    await db.flush()
+    await refresh_attendance_rollups(db, [(student_id, attendance_day)])
     await db.commit()
 
     logger.info(f"Attendance {attendance_id} deleted by user {current_user.id}")
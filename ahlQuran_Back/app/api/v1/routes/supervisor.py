@@ -7,7 +7,9 @@ from app.models.user import User, UserRoleEnum
 from app.models.supervisor import Supervisor
 from app.schemas.supervisor import SupervisorCreate, SupervisorUpdate, SupervisorResponse, SupervisorList
 from app.core.dependencies import get_current_user, require_president
-from app.core.security import get_password_hash
+from app.core.principals import Principal, invalidate_user_principal
+from app.core.security import hash_password
+from app.core.pagination import count_total
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,7 +34,7 @@ def map_supervisor_to_response(supervisor: Supervisor) -> SupervisorResponse:
 async def create_supervisor(
     supervisor_data: SupervisorCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president)
+    current_user: Principal = Depends(require_president)
 ):
     """Create a new supervisor. Only presidents can create supervisors."""
     
@@ -53,7 +55,7 @@ async def create_supervisor(
         firstname=supervisor_data.firstname,
         lastname=supervisor_data.lastname,
         email=supervisor_data.email,
-        hashed_password=get_password_hash(supervisor_data.password),
+        hashed_password=await hash_password(supervisor_data.password),
         role=UserRoleEnum.SUPERVISOR,
         is_active=True
     )
@@ -87,8 +89,9 @@ async def create_supervisor(
 async def list_supervisors(
     skip: int = 0,
     limit: int = 100,
+    estimate_total: bool = False,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president)
+    current_user: Principal = Depends(require_president)
 ):
     """Get all supervisors. Only presidents can view supervisors."""
 
@@ -100,8 +103,12 @@ async def list_supervisors(
     supervisors = result.scalars().unique().all()
 
     # Get total count
-    count_result = await db.execute(select(Supervisor))
-    total = len(count_result.scalars().all())
+    total = await count_total(
+        db,
+        select(Supervisor),
+        cache_key="supervisors",
+        estimate_table=Supervisor.__tablename__ if estimate_total else None
+    )
 
     supervisor_responses = [map_supervisor_to_response(supervisor) for supervisor in supervisors]
 
@@ -112,7 +119,7 @@ async def list_supervisors(
 async def get_supervisor(
     supervisor_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president)
+    current_user: Principal = Depends(require_president)
 ):
     """Get a specific supervisor by ID. Only presidents can view supervisors."""
 
@@ -137,7 +144,7 @@ async def update_supervisor(
     supervisor_id: int,
     supervisor_data: SupervisorUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president)
+    current_user: Principal = Depends(require_president)
 ):
     """Update supervisor information. Only presidents can update supervisors."""
 
@@ -175,11 +182,12 @@ async def update_supervisor(
     
     # Update password if provided
     if "password" in update_data and update_data["password"]:
-        supervisor.user.hashed_password = get_password_hash(update_data["password"])
+        supervisor.user.hashed_password = await hash_password(update_data["password"])
 
     await db.commit()
     await db.refresh(supervisor)
     await db.refresh(supervisor.user)
+    invalidate_user_principal(supervisor.user_id)
 
     logger.info(f"Supervisor {supervisor_id} updated by user {current_user.id}")
 
@@ -190,7 +198,7 @@ async def update_supervisor(
 async def delete_supervisor(
     supervisor_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president)
+    current_user: Principal = Depends(require_president)
 ):
     """Delete a supervisor. Only presidents can delete supervisors."""
 
@@ -208,6 +216,7 @@ async def delete_supervisor(
     # Delete the supervisor (will cascade to user due to relationship)
     await db.delete(supervisor)
     await db.commit()
+    invalidate_user_principal(supervisor.user_id)
 
     logger.info(f"Supervisor {supervisor_id} deleted by user {current_user.id}")
 
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.core.dependencies import require_teacher_or_above
+from app.core.principals import Principal
+from app.models.user import UserRoleEnum
+from app.models.teacher import Teacher
+from app.schemas.sync import SyncResponse, SyncChanges, SyncDeletions, SyncEnrollment
+from app.schemas.attendance import AttendanceResponse
+from app.schemas.achievement import AchievementResponse
+from app.services.sync import SyncCursor, SyncScope, collect_changes
+from app.api.v1.routes.lectures import map_lecture_to_response
+from app.api.v1.routes.student import map_student_to_response
+
+syncRouter = APIRouter()
+
+
+@syncRouter.get("/", response_model=SyncResponse)
+async def sync(
+    since: Optional[str] = Query(None, description="next_cursor of the previous call; omit for a full sync"),
+    limit: int = Query(500, ge=1, le=2000),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_teacher_or_above)
+):
+    """
+    Delta sync for offline clients: lectures, students, enrollments, attendance and
+    achievements created, updated or deleted since the cursor.
+
+    Call repeatedly with the returned next_cursor while has_more is true, then keep the
+    last next_cursor for the next sync. Teachers only receive the rows and deletions of
+    the lectures they teach; a 410 means the cursor expired or the teacher's lectures or
+    students changed, and the client must start over with a full sync.
+    """
+    scope = None
+    if current_user.role == UserRoleEnum.TEACHER:
+        result = await db.execute(select(Teacher.id).where(Teacher.user_id == current_user.id))
+        teacher_id = result.scalar_one_or_none()
+        if teacher_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="No teacher profile found for this account"
+            )
+        scope = SyncScope(teacher_id=teacher_id)
+
+    cursor = SyncCursor.decode(since) if since else None
+    page = await collect_changes(db, cursor, limit, scope)
+
+    return SyncResponse(
+        changes=SyncChanges(
+            lectures=[map_lecture_to_response(lecture) for lecture in page.changes["lectures"]],
+            students=[map_student_to_response(student) for student in page.changes["students"]],
+            enrollments=[SyncEnrollment.model_validate(enrollment) for enrollment in page.changes["enrollments"]],
+            attendance=[AttendanceResponse.model_validate(attendance) for attendance in page.changes["attendance"]],
+            achievements=[AchievementResponse.model_validate(achievement) for achievement in page.changes["achievements"]]
+        ),
+        deleted=SyncDeletions(**page.deleted),
+        next_cursor=page.next_cursor.encode(),
+        has_more=page.has_more,
+        server_time=page.server_time
+    )
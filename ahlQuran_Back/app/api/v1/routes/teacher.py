@@ -1,13 +1,21 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, cast, extract, and_, type_coerce, Integer
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import selectinload
 from app.db.session import get_db
 from app.models.user import User, UserRoleEnum
 from app.models.teacher import Teacher
 from app.schemas.teacher import TeacherCreate, TeacherUpdate, TeacherResponse, TeacherList
+from app.schemas.types import DayDate
 from app.core.dependencies import require_president_or_supervisor
+from app.core.principals import Principal, invalidate_user_principal
+from app.core.response_cache import LECTURE_CATALOGUE, invalidate_namespace
 from app.core.security import get_password_hash
+from app.core.pagination import count_total
+from app.core.dates import filter_by_day, parse_month
+from app.core.etag import TEACHER_LIST_TABLES, check_not_modified
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,7 +27,7 @@ teacherRouter = APIRouter()
 async def create_teacher(
     teacher_data: TeacherCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Create a new teacher. Only presidents and supervisors can create teachers."""
     logger.debug(f"teacher data :  {teacher_data} \n current user: {current_user}")
@@ -79,7 +87,7 @@ async def create_teacher(
 async def get_teacher(
     teacher_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Get a specific teacher by ID."""
 
@@ -110,13 +118,20 @@ async def get_teacher(
 
 @teacherRouter.get("/", response_model=TeacherList)
 async def list_teachers(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    estimate_total: bool = False,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Get all teachers. Only presidents and supervisors can view all teachers."""
 
+    not_modified = await check_not_modified(db, request, response, TEACHER_LIST_TABLES)
+    if not_modified is not None:
+        return not_modified
+
     result = await db.execute(
         select(Teacher)
         .options(selectinload(Teacher.user))
@@ -126,8 +141,12 @@ async def list_teachers(
     teachers = result.scalars().all()
 
     # Get total count
-    count_result = await db.execute(select(Teacher))
-    total = len(count_result.scalars().all())
+    total = await count_total(
+        db,
+        select(Teacher),
+        cache_key="teachers",
+        estimate_table=Teacher.__tablename__ if estimate_total else None
+    )
 
     teacher_responses = [
         TeacherResponse(
@@ -151,7 +170,7 @@ async def update_teacher(
     teacher_id: int,
     teacher_data: TeacherUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Update teacher information. Only presidents and supervisors can update teachers."""
 
@@ -192,6 +211,9 @@ async def update_teacher(
         teacher.riwaya = update_data["riwaya"]
 
     await db.commit()
+    invalidate_user_principal(teacher.user_id)
+    # Teacher names are part of the lecture catalogue
+    await invalidate_namespace(LECTURE_CATALOGUE)
     await db.refresh(teacher)
     await db.refresh(teacher.user)
 
@@ -213,7 +235,7 @@ async def update_teacher(
 async def delete_teacher(
     teacher_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Delete a teacher. Only presidents and supervisors can delete teachers."""
 
@@ -231,6 +253,9 @@ async def delete_teacher(
     # Delete the teacher (will cascade to user due to relationship)
     await db.delete(teacher)
     await db.commit()
+    invalidate_user_principal(teacher.user_id)
+    # Teacher names are part of the lecture catalogue
+    await invalidate_namespace(LECTURE_CATALOGUE)
     
     logger.info(f"Teacher {teacher_id} deleted by user {current_user.id}")
 
@@ -250,8 +275,114 @@ from app.schemas.teacher_attendance import (
     TeacherAttendanceCreate,
     TeacherAttendanceUpdate,
     TeacherAttendanceResponse,
-    TeacherAttendanceList
+    TeacherAttendanceList,
+    TeacherAttendanceBulk,
+    TeacherAttendanceSheet,
+    TeacherAttendanceSheetRow
 )
+from app.services.attendance import upsert_attendances
+
+
+@teacherRouter.post("/attendance", response_model=TeacherAttendanceList)
+async def mark_teachers_attendance(
+    attendance_data: TeacherAttendanceBulk,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Create or update the attendance of several teachers for one date.
+    All rows are written with a single upsert on (teacher_id, date).
+    """
+    teacher_ids = [entry.teacher_id for entry in attendance_data.entries]
+    if len(set(teacher_ids)) != len(teacher_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each teacher may appear only once per request"
+        )
+
+    result = await db.execute(select(Teacher.id).where(Teacher.id.in_(teacher_ids)))
+    missing = sorted(set(teacher_ids) - set(result.scalars().all()))
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Teachers not found: {missing}"
+        )
+
+    attendances = await upsert_attendances(
+        db,
+        TeacherAttendance,
+        "teacher_id",
+        [
+            {
+                "teacher_id": entry.teacher_id,
+                "date": attendance_data.date,
+                "status": entry.status.value,
+                "notes": entry.notes,
+            }
+            for entry in attendance_data.entries
+        ]
+    )
+    await db.commit()
+
+    logger.info(
+        f"Attendance of {len(attendances)} teacher(s) saved on {attendance_data.date} "
+        f"by user {current_user.id}"
+    )
+
+    return TeacherAttendanceList(attendances=attendances, total=len(attendances))
+
+
+@teacherRouter.get("/attendance/sheet", response_model=TeacherAttendanceSheet)
+async def get_teacher_attendance_sheet(
+    month: str = Query(..., description="Month in MM-YYYY format", example="12-2024"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_president_or_supervisor)
+):
+    """
+    Teacher x day attendance matrix for one month, built with a single grouped query.
+    Teachers without any attendance that month get a row of nulls.
+    """
+    first_day, last_day = parse_month(month)
+
+    # {day of month: status} per teacher; the range lives in the join so that
+    # teachers without attendance that month are kept
+    day_statuses = type_coerce(
+        func.jsonb_object_agg(
+            cast(extract("day", TeacherAttendance.date), Integer),
+            TeacherAttendance.status
+        ).filter(TeacherAttendance.id.isnot(None)),
+        JSONB
+    )
+    result = await db.execute(
+        select(Teacher.id, User.firstname, User.lastname, day_statuses)
+        .join(User, User.id == Teacher.user_id)
+        .outerjoin(
+            TeacherAttendance,
+            and_(
+                TeacherAttendance.teacher_id == Teacher.id,
+                TeacherAttendance.date.between(first_day, last_day)
+            )
+        )
+        .group_by(Teacher.id, User.firstname, User.lastname)
+        .order_by(Teacher.id)
+    )
+
+    days_in_month = last_day.day
+    rows = []
+    for teacher_id, firstname, lastname, statuses in result.all():
+        statuses = statuses or {}
+        rows.append(TeacherAttendanceSheetRow(
+            teacher_id=teacher_id,
+            firstname=firstname,
+            lastname=lastname,
+            days=[statuses.get(str(day)) for day in range(1, days_in_month + 1)]
+        ))
+
+    return TeacherAttendanceSheet(
+        month=first_day.strftime("%m-%Y"),
+        days_in_month=days_in_month,
+        teachers=rows
+    )
 
 
 @teacherRouter.post("/{teacher_id}/attendance", response_model=TeacherAttendanceResponse, status_code=status.HTTP_201_CREATED)
@@ -259,7 +390,7 @@ async def create_teacher_attendance(
     teacher_id: int,
     attendance_data: TeacherAttendanceCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Create or update attendance record for a teacher on a specific date."""
 
@@ -320,13 +451,18 @@ async def create_teacher_attendance(
 @teacherRouter.get("/{teacher_id}/attendance", response_model=TeacherAttendanceList)
 async def get_teacher_attendance(
     teacher_id: int,
-    date: str = None,
+    date: Optional[DayDate] = None,
+    date_from: Optional[DayDate] = Query(None, alias="from"),
+    date_to: Optional[DayDate] = Query(None, alias="to"),
     skip: int = 0,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
-    """Get attendance records for a specific teacher. Optionally filter by date."""
+    """
+    Get attendance records for a specific teacher, newest first. Optionally filter
+    by date or by an inclusive `from`/`to` date range.
+    """
 
     # Verify teacher exists
     result = await db.execute(
@@ -342,24 +478,16 @@ async def get_teacher_attendance(
 
     # Build query
     query = select(TeacherAttendance).where(TeacherAttendance.teacher_id == teacher_id)
+    query = filter_by_day(query, TeacherAttendance.date, date, date_from, date_to)
     
-    # Filter by date if provided
-    if date:
-        query = query.where(TeacherAttendance.date == date)
-    
-    query = query.order_by(TeacherAttendance.created_at.desc()).offset(skip).limit(limit)
-
     # Get attendance records
-    attendance_result = await db.execute(query)
+    attendance_result = await db.execute(
+        query.order_by(TeacherAttendance.date.desc()).offset(skip).limit(limit)
+    )
     attendances = attendance_result.scalars().all()
 
     # Get total count
-    count_query = select(TeacherAttendance).where(TeacherAttendance.teacher_id == teacher_id)
-    if date:
-        count_query = count_query.where(TeacherAttendance.date == date)
-    
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    total = await count_total(db, query)
 
     return TeacherAttendanceList(attendances=list(attendances), total=total)
 
@@ -370,7 +498,7 @@ async def update_teacher_attendance(
     attendance_id: int,
     attendance_data: TeacherAttendanceUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Update a teacher attendance record."""
 
@@ -406,7 +534,7 @@ async def delete_teacher_attendance(
     teacher_id: int,
     attendance_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_president_or_supervisor)
+    current_user: Principal = Depends(require_president_or_supervisor)
 ):
     """Delete a teacher attendance record."""
 
@@ -11,10 +11,21 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PASSWORD_HASH_WORKERS: int = 4  # Threads used for bcrypt hashing/verification
+    TOKEN_CACHE_SIZE: int = 10000  # Verified JWT payloads kept in memory
     
     # API
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "Ahl Quran School Management"
+
+    # Caching
+    COUNT_CACHE_TTL_SECONDS: int = 0  # 0 disables caching of list totals
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # 0 disables caching of authenticated users
+    RESPONSE_CACHE_TTL_SECONDS: int = 60  # 0 disables the lecture catalogue response cache
+
+    # Offline sync
+    SYNC_OVERLAP_SECONDS: int = 5  # Each sync re-reads this much of the previous window
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 90  # Older cursors must do a full sync
     
     # Environment
     DEBUG: bool = False
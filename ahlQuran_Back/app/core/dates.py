@@ -0,0 +1,64 @@
+import calendar
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select
+
+
+def day_filters(
+    column,
+    day: Optional[date] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+) -> list:
+    """
+    WHERE clauses selecting a single day or an inclusive [date_from, date_to] range
+    on a DATE column, raising 400 when the range is reversed.
+    """
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' date must not be after 'to' date"
+        )
+
+    filters = []
+    if day is not None:
+        filters.append(column == day)
+    if date_from is not None:
+        filters.append(column >= date_from)
+    if date_to is not None:
+        filters.append(column <= date_to)
+    return filters
+
+
+def filter_by_day(
+    query: Select,
+    column,
+    day: Optional[date] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+) -> Select:
+    """Apply day_filters to query"""
+    return query.where(*day_filters(column, day, date_from, date_to))
+
+
+def parse_month(value: str) -> tuple[date, date]:
+    """
+    Parse a month given as MM-YYYY (client format) or YYYY-MM into its first and
+    last day, raising 400 when it is malformed.
+    """
+    for fmt in ("%m-%Y", "%Y-%m"):
+        try:
+            first_day = datetime.strptime(value, fmt).date()
+            break
+        except ValueError:
+            continue
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Month must be in MM-YYYY format"
+        )
+
+    days_in_month = calendar.monthrange(first_day.year, first_day.month)[1]
+    return first_day, first_day.replace(day=days_in_month)
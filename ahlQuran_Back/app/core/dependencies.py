@@ -4,6 +4,9 @@ from sqlalchemy import select
 from app.db.session import get_db
 from app.models.user import User, UserRoleEnum
 from app.core.security import decode_token
+from app.core.principals import (
+    Principal, principal_cache, principal_from_user, principal_from_admin
+)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -13,7 +16,12 @@ logger = logging.getLogger(__name__)
 async def get_current_user(
         request: Request,  # ← Use Request instead of Cookie
         db: AsyncSession = Depends(get_db)
-):
+) -> Principal:
+    """
+    Resolve the caller from the access token. Principals are cached per user id
+    for PRINCIPAL_CACHE_TTL_SECONDS, so the common path runs no auth queries;
+    routes that change a user's status must call invalidate_user_principal.
+    """
     # Try to get token from cookies first
     access_token = request.cookies.get("access_token")
     
@@ -29,14 +37,11 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-    logger.info(f"Received credentials: {access_token}")
     # Remove "Bearer " prefix if present
     token = access_token.replace("Bearer ", "")
 
-    logger.info(f"valid token : {token}")
-    # Decode token
+    # Decode token (verified payloads are cached by token digest)
     payload = decode_token(token)
-    logger.info(f"valid payload : {payload}")
     
     # Check if token decode failed
     if payload is None:
@@ -61,6 +66,10 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        principal = principal_cache.get(("admin", admin_id))
+        if principal is not None:
+            return principal
+
         result = await db.execute(
             select(Admin).where(Admin.id == admin_id)
         )
@@ -73,7 +82,9 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        return admin
+        principal = principal_from_admin(admin)
+        principal_cache.set(("admin", admin_id), principal)
+        return principal
 
     # For user tokens
     user_id = payload.get("user_id")
@@ -84,40 +95,40 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
+    principal = principal_cache.get(("user", user_id))
+    if principal is None:
+        result = await db.execute(
+            select(User).where(User.id == user_id)
         )
+        user = result.scalar_one_or_none()
 
-    if not user.is_active:
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        principal = principal_from_user(user)
+        principal_cache.set(("user", user_id), principal)
+
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Account is inactive. Please wait for administrator approval."
         )
 
-    return user
+    return principal
 
 # ==================== ROLE-BASED DEPENDENCIES ====================
 
 async def require_admin(
-    current_user = Depends(get_current_user)
-):
-    from app.models.admin import Admin
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     logger.info(f"the current admin : {current_user}")
 
-    # If it's an Admin object, allow access
-    if isinstance(current_user, Admin):
-        return current_user
-
-    # If it's a User with ADMIN role, allow access
-    if hasattr(current_user, 'role') and current_user.role != "admin":
+    # Only principals resolved from an admin token carry the admin role
+    if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="This action requires administrator privileges"
@@ -126,8 +137,8 @@ async def require_admin(
     return current_user
 
 async def require_president(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     if current_user.role != UserRoleEnum.PRESIDENT:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -137,8 +148,8 @@ async def require_president(
 
 
 async def require_supervisor(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     if current_user.role != UserRoleEnum.SUPERVISOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -148,8 +159,8 @@ async def require_supervisor(
 
 
 async def require_president_or_supervisor(
-    current_user: User = Depends(get_current_user)
-):
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     allowed = [UserRoleEnum.PRESIDENT, UserRoleEnum.SUPERVISOR]
     if current_user.role not in allowed:
         raise HTTPException(
@@ -160,8 +171,8 @@ async def require_president_or_supervisor(
 
 
 async def require_teacher(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     if current_user.role != UserRoleEnum.TEACHER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -171,8 +182,8 @@ async def require_teacher(
 
 
 async def require_teacher_or_above(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     allowed = [UserRoleEnum.TEACHER, UserRoleEnum.SUPERVISOR, UserRoleEnum.PRESIDENT]
     if current_user.role not in allowed:
         raise HTTPException(
@@ -0,0 +1,83 @@
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Tables carrying a <table>_version_seq sequence, advanced at commit by a trigger
+TRACKED_TABLES = frozenset({
+    "users", "students", "teachers", "guardians", "lectures",
+    "lecture_teachers", "weekly_schedules", "session_participations",
+})
+
+# Tables rendered by each list endpoint; any write to them changes the ETag
+STUDENT_LIST_TABLES = ("students", "users", "session_participations", "lectures")
+TEACHER_LIST_TABLES = ("teachers", "users")
+GUARDIAN_LIST_TABLES = ("guardians", "users", "students")
+LECTURE_LIST_TABLES = ("lectures", "lecture_teachers", "weekly_schedules", "teachers", "users")
+
+
+async def compute_list_etag(db: AsyncSession, request: Request, tables: Iterable[str]) -> str:
+    """
+    Weak ETag from the version sequences of the given tables, the route path and
+    its query parameters. Costs a read of each sequence instead of the list query.
+    """
+    tables = sorted(tables)
+    unknown = set(tables) - TRACKED_TABLES
+    if unknown:
+        raise ValueError(f"Tables without a version sequence: {sorted(unknown)}")
+
+    # Names come from TRACKED_TABLES, safe to inline
+    result = await db.execute(text(" UNION ALL ".join(
+        f"SELECT '{table}', last_value FROM {table}_version_seq" for table in tables
+    )))
+    versions = dict(result.all())
+
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    fingerprint = "|".join(f"{table}={versions.get(table, 0)}" for table in tables)
+    digest = hashlib.sha1(f"{request.url.path}?{query}|{fingerprint}".encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of etag against the If-None-Match header"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    if "*" in candidates:
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    # Let clients keep the body but always revalidate it
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified_response(etag: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag_headers(response, etag)
+    return response
+
+
+async def check_not_modified(
+    db: AsyncSession,
+    request: Request,
+    response: Response,
+    tables: Iterable[str]
+) -> Optional[Response]:
+    """
+    Compute the list ETag and attach it to response. Returns a 304 response to
+    send as-is when the client already has the current representation.
+    """
+    etag = await compute_list_etag(db, request, tables)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    set_etag_headers(response, etag)
+    return None
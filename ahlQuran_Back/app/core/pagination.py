@@ -0,0 +1,100 @@
+import base64
+import json
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+# Short-lived cache of list totals, disabled when COUNT_CACHE_TTL_SECONDS is 0
+count_cache = TTLCache(ttl=settings.COUNT_CACHE_TTL_SECONDS)
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the key of the last row of a page into an opaque cursor"""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by encode_cursor, raising 400 if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_id = data["id"]
+        if not isinstance(last_id, int):
+            raise ValueError("cursor id must be an integer")
+        return last_id
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def next_cursor_for(rows: list, limit: int) -> Optional[str]:
+    """Return the cursor of the next page, or None when this page is the last one"""
+    if not rows or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1].id)
+
+
+async def estimate_total(db: AsyncSession, table_name: str) -> Optional[int]:
+    """
+    Planner row estimate from pg_class.reltuples. Only meaningful for unfiltered
+    listings; returns None when the table has never been analyzed.
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table_name}
+    )
+    estimate = result.scalar_one_or_none()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
+
+
+async def count_total(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    distinct_column=None,
+    cache_key: Optional[str] = None,
+    estimate_table: Optional[str] = None
+) -> int:
+    """
+    Count the rows matched by the FROM/WHERE clauses of stmt with a single
+    SELECT count(*) (or count(DISTINCT distinct_column) for joined filters).
+
+    stmt should be the filtered query before ordering/offset/limit are applied.
+    When estimate_table is given the pg_class estimate is returned instead,
+    falling back to an exact count if no estimate is available.
+    """
+    if cache_key is not None:
+        # Estimates and exact totals of the same listing are cached apart so a
+        # caller asking for an exact total never receives an estimate
+        cache_key = f"{cache_key}:{'estimate' if estimate_table is not None else 'exact'}"
+        cached = count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    total = None
+    if estimate_table is not None:
+        total = await estimate_total(db, estimate_table)
+
+    if total is None:
+        if distinct_column is not None:
+            count_expr = func.count(func.distinct(distinct_column))
+        else:
+            count_expr = func.count()
+        count_stmt = stmt.with_only_columns(count_expr, maintain_column_froms=True).order_by(None)
+        result = await db.execute(count_stmt)
+        total = result.scalar_one()
+
+    if cache_key is not None:
+        count_cache.set(cache_key, total)
+    return total
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import UserRoleEnum
+
+ADMIN_ROLE = "admin"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated caller resolved by get_current_user.
+    Detached from any DB session so it can be cached between requests.
+    """
+    id: int
+    role: Union[UserRoleEnum, str]  # UserRoleEnum for users, "admin" for admin accounts
+    is_active: bool
+    email: Optional[str] = None
+    firstname: Optional[str] = None
+    lastname: Optional[str] = None
+    user: Optional[str] = None  # Admin username
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == ADMIN_ROLE
+
+
+# Per-process cache; invalidation below only reaches the current worker,
+# the TTL bounds how long other workers can serve a stale principal
+principal_cache = TTLCache(ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS, maxsize=4096)
+
+
+def principal_from_user(user) -> Principal:
+    return Principal(
+        id=user.id,
+        role=user.role,
+        is_active=user.is_active,
+        email=user.email,
+        firstname=user.firstname,
+        lastname=user.lastname
+    )
+
+
+def principal_from_admin(admin) -> Principal:
+    return Principal(
+        id=admin.id,
+        role=ADMIN_ROLE,
+        is_active=True,
+        user=admin.user
+    )
+
+
+def invalidate_user_principal(user_id: int) -> None:
+    """Call after a user's role, status or identity changes, or after it is deleted"""
+    principal_cache.pop(("user", user_id))
+
+
+def invalidate_admin_principal(admin_id: int) -> None:
+    principal_cache.pop(("admin", admin_id))
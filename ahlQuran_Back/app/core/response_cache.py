@@ -0,0 +1,83 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from fastapi import Request
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Namespaces, invalidated as a whole whenever data they render changes
+LECTURE_CATALOGUE = "lectures"
+
+
+class ResponseCache(ABC):
+    """
+    Cache of rendered response bodies grouped in namespaces.
+    Async so that an out-of-process backend (e.g. Redis) can implement it.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, body: bytes) -> None:
+        ...
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> None:
+        """Drop every cached response of the namespace"""
+        ...
+
+    @abstractmethod
+    def stats(self) -> dict:
+        ...
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Per-process backend; other workers only catch up once their entries expire"""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self._cache = TTLCache(ttl=ttl, maxsize=maxsize)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, body: bytes) -> None:
+        self._cache.set(key, body)
+
+    async def invalidate(self, namespace: str) -> None:
+        self._cache.pop_prefix(f"{namespace}:")
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+response_cache: ResponseCache = InMemoryResponseCache(ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+def set_response_cache(cache: ResponseCache) -> None:
+    """Swap the backend, e.g. at startup"""
+    global response_cache
+    response_cache = cache
+
+
+def get_response_cache() -> ResponseCache:
+    return response_cache
+
+
+def response_cache_key(request: Request, namespace: str, version: Optional[str] = None) -> str:
+    """
+    Key made of the namespace, route path and sorted query parameters. Routes that
+    send an ETag pass it as version so a cached body is only served with the ETag
+    it was rendered under, whatever worker invalidated (or not) its cache.
+    """
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    key = f"{namespace}:{request.url.path}?{query}"
+    if version is not None:
+        key = f"{key}#{version}"
+    return key
+
+
+async def invalidate_namespace(namespace: str) -> None:
+    await get_response_cache().invalidate(namespace)
@@ -1,8 +1,13 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.cache import TTLCache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,6 +23,30 @@ def get_password_hash(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+
+# bcrypt is deliberately slow (~250 ms) and releases the GIL, so async handlers
+# run it on a bounded thread pool instead of blocking the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
+
+async def hash_password(password: str) -> str:
+    """Async variant of get_password_hash, executed on the hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, get_password_hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """Async variant of verify_password, executed on the hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_hasher() -> None:
+    _hash_executor.shutdown(wait=False, cancel_futures=True)
+
 # JWT token creation and verification
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
@@ -46,14 +75,31 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     )
     return encoded_jwt
 
+# Verified payloads keyed by the SHA-256 digest of the token, so raw tokens
+# are never kept in memory; each entry expires together with its token
+token_cache = TTLCache(
+    ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    maxsize=settings.TOKEN_CACHE_SIZE
+)
+
+
 def decode_token(token: str) -> Optional[dict]:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError as e:
         logger.error(f"Token decode error: {e}")
         return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(key, payload, ttl=exp - time.time())
+    return dict(payload)
@@ -6,6 +6,7 @@ import logging
 
 from app.core.config import settings
 from app.db.init_db import init_db
+from app.core.security import shutdown_password_hasher
 from app.api.v1.routes import register_routes
 
 
@@ -29,6 +30,7 @@ async def lifespan(app : FastAPI):
         raise
     yield
     logger.info("👋 Shutting down application...")
+    shutdown_password_hasher()
 
 
 app = FastAPI(
@@ -11,6 +11,10 @@ from app.models.session import Session
 from app.models.sessionParticipation import SessionParticipation, ParticipationStatus
 from app.models.acheivements import Achievement
 from app.models.lecture import Lecture, WeeklySchedule
+from app.models.attendance_rollup import AttendanceMonthlyRollup
+from app.models.sync_tombstone import SyncTombstone
+from app.models.memorization_coverage import MemorizationCoverage
+from app.models.achievement_rollup import AchievementMonthlyRollup
 
 __all__ = [
     "User",
@@ -27,4 +31,8 @@ __all__ = [
     "Achievement",
     "Lecture",
     "WeeklySchedule",
+    "AttendanceMonthlyRollup",
+    "SyncTombstone",
+    "MemorizationCoverage",
+    "AchievementMonthlyRollup",
 ]
\ No newline at end of file
@@ -1,7 +1,8 @@
-from sqlalchemy import String, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum
+from sqlalchemy import DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Date, Index, Computed
+from sqlalchemy.dialects.postgresql import INT4RANGE, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
-from datetime import datetime, timezone
+from datetime import date as Day, datetime, timezone
 from typing import Optional
 from enum import Enum
 
@@ -15,6 +16,10 @@ class AchievementType(str, Enum):
 
 class Achievement(Base):
     __tablename__ = "achievements"
+    __table_args__ = (
+        Index("ix_achievements_student_date", "student_id", "date"),
+        Index("ix_achievements_verse_range", "verse_range", postgresql_using="gist"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id", ondelete="CASCADE"))
@@ -24,13 +29,20 @@ class Achievement(Base):
     from_verse: Mapped[int] = mapped_column(Integer, nullable=False)
     to_verse: Mapped[int] = mapped_column(Integer, nullable=False)
 
+    # Global verse indices covered, generated by the database (see the quran_verse_range
+    # SQL function); NULL when the range does not exist in the Quran
+    verse_range: Mapped[Optional[Range[int]]] = mapped_column(
+        INT4RANGE,
+        Computed("quran_verse_range(from_surah, from_verse, to_surah, to_verse)", persisted=True)
+    )
+
     note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     achievement_type: Mapped[AchievementType] = mapped_column(
         SQLEnum(AchievementType, values_callable=lambda x: [e.value for e in x]),
         default=AchievementType.NORMAL,
         nullable=False
     )
-    date: Mapped[str] = mapped_column(String(10), nullable=False, index=True)  # Format: DD-MM-YYYY
+    date: Mapped[Day] = mapped_column(Date, nullable=False, index=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,31 @@
+from sqlalchemy import DateTime, ForeignKey, Integer, Date, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+from datetime import date as Day, datetime, timezone
+from typing import Optional
+
+
+class AchievementMonthlyRollup(Base):
+    """
+    Per-student, per-month verse counters backing the memorization leaderboard.
+    Counts are distinct verses within the month; summing months may count a verse twice.
+    Derived from achievements and maintained by app.services.achievement_rollup
+    in the same transaction as every achievement write.
+    """
+    __tablename__ = "achievement_monthly_rollups"
+    __table_args__ = (
+        # Top-N of a month is an index scan
+        Index("ix_achievement_rollups_month_new", "month", "verses_new"),
+        Index("ix_achievement_rollups_month_revised", "month", "verses_revised"),
+    )
+
+    student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[Day] = mapped_column(Date, primary_key=True)  # First day of the month
+
+    verses_new: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)  # normal achievements
+    verses_revised: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)  # small and big
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self) -> str:
+        return f"AchievementMonthlyRollup(student_id={self.student_id}, month={self.month}, new={self.verses_new}, revised={self.verses_revised})"
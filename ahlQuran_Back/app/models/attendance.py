@@ -1,7 +1,7 @@
-from sqlalchemy import String, DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Date
+from sqlalchemy import DateTime, ForeignKey, Integer, Text, Enum as SQLEnum, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
-from datetime import datetime, timezone
+from datetime import date as Day, datetime, timezone
 from typing import Optional
 from enum import Enum
 
@@ -18,10 +18,13 @@ class AttendanceStatus(str, Enum):
 
 class Attendance(Base):
     __tablename__ = "attendances"
+    __table_args__ = (
+        Index("ix_attendances_student_date", "student_id", "date", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False, index=True)
-    date: Mapped[str] = mapped_column(String(10), nullable=False, index=True)  # Format: DD-MM-YYYY
+    date: Mapped[Day] = mapped_column(Date, nullable=False, index=True)
     status: Mapped[AttendanceStatus] = mapped_column(
         SQLEnum(AttendanceStatus, values_callable=lambda x: [e.value for e in x]),
         default=AttendanceStatus.PRESENT,
@@ -0,0 +1,28 @@
+from sqlalchemy import DateTime, ForeignKey, Integer, Date
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+from datetime import date as Day, datetime, timezone
+from typing import Optional
+
+
+class AttendanceMonthlyRollup(Base):
+    """
+    Per-student, per-month attendance counters.
+    Derived from attendances and maintained by app.services.attendance_rollup
+    in the same transaction as every attendance write.
+    """
+    __tablename__ = "attendance_monthly_rollups"
+
+    student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    month: Mapped[Day] = mapped_column(Date, primary_key=True, index=True)  # First day of the month
+
+    present: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    late: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    absent: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    excused: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    total: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self) -> str:
+        return f"AttendanceMonthlyRollup(student_id={self.student_id}, month={self.month}, total={self.total})"
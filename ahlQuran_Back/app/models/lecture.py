@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer, ForeignKey, DateTime, Boolean, Table, Column
+from sqlalchemy import String, Integer, ForeignKey, DateTime, Boolean, Table, Column, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
 from typing import Optional, List
@@ -31,8 +31,14 @@ class Lecture(Base):
     category: Mapped[str] = mapped_column(String(50), nullable=False)  # "male", "female", or "both"
     shown_on_website: Mapped[bool] = mapped_column(Boolean, default=False)
     
+    # Distinct enrolled students, maintained by app.services.enrollment
+    student_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
+    # Used by the delta sync API; set by database triggers on any change of the lecture,
+    # its student_count, teachers or schedules, never written by the application
+    changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     teachers: Mapped[List["Teacher"]] = relationship(
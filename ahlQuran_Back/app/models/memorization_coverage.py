@@ -0,0 +1,23 @@
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+from datetime import datetime, timezone
+from typing import Optional
+
+
+class MemorizationCoverage(Base):
+    """
+    Verses of the Quran covered by a student's achievements, one bit per verse
+    (see app.quran.CoverageBitmap). Maintained by app.services.coverage whenever
+    achievements change.
+    """
+    __tablename__ = "memorization_coverages"
+
+    student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    bitmap: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    verse_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self) -> str:
+        return f"MemorizationCoverage(student_id={self.student_id}, verse_count={self.verse_count})"
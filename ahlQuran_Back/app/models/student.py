@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import String, Integer, ForeignKey, DateTime, Boolean, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
 from typing import Optional, List
@@ -46,6 +46,15 @@ class Student(Base):
     
     guardian_id: Mapped[Optional[int]] = mapped_column(Integer)
     
+    # Used by the delta sync API
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False
+    )
+    
     # Many-to-Many relationship with Sessions through SessionParticipation
     participations: Mapped[List["SessionParticipation"]] = relationship(
         "SessionParticipation",
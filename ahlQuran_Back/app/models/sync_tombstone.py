@@ -0,0 +1,27 @@
+from sqlalchemy import String, DateTime, Integer, BigInteger, Index, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+from datetime import datetime
+from typing import Optional
+
+
+class SyncTombstone(Base):
+    """
+    Record of a deleted row, written by an AFTER DELETE trigger on every table
+    served by the delta sync API (cascaded deletes included).
+    """
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones_teacher_ids", "teacher_ids", postgresql_using="gin"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    table_name: Mapped[str] = mapped_column(String(63), nullable=False)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Teachers whose lectures held the row when it was deleted, resolved by the trigger
+    teacher_ids: Mapped[Optional[list[int]]] = mapped_column(ARRAY(Integer), nullable=True)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"SyncTombstone(table_name={self.table_name}, row_id={self.row_id}, deleted_at={self.deleted_at})"
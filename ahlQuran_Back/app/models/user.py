@@ -26,6 +26,15 @@ class User(Base):
 
     # Account status fields
     is_active: Mapped[bool] = mapped_column(Boolean, default=False)
+
+    # Used by the delta sync API
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False
+    )
     
     # Relationships
     president: Mapped[Optional["President"]] = relationship(
@@ -0,0 +1,26 @@
+# Quran metadata, loaded once at import from quran.json
+from app.quran.metadata import (
+    Surah, SURAHS, SURAH_COUNT, TOTAL_AYAHS, AYAH_COUNTS, SURAH_OFFSETS, JUZ_COUNT, JUZ_OFFSETS
+)
+from app.quran.verses import is_valid_verse, global_index, surah_verse, range_indices, verse_count
+from app.quran.coverage import CoverageBitmap
+from app.quran.intervals import merge_intervals, covered_count
+
+__all__ = [
+    "Surah",
+    "SURAHS",
+    "SURAH_COUNT",
+    "TOTAL_AYAHS",
+    "AYAH_COUNTS",
+    "SURAH_OFFSETS",
+    "JUZ_COUNT",
+    "JUZ_OFFSETS",
+    "is_valid_verse",
+    "global_index",
+    "surah_verse",
+    "range_indices",
+    "verse_count",
+    "CoverageBitmap",
+    "merge_intervals",
+    "covered_count",
+]
@@ -0,0 +1,51 @@
+from typing import Iterable, Optional
+
+from app.quran.metadata import JUZ_COUNT, JUZ_OFFSETS, SURAH_COUNT, SURAH_OFFSETS, TOTAL_AYAHS
+
+# Bytes needed to store one bit per verse
+BITMAP_BYTES = (TOTAL_AYAHS + 7) // 8
+
+
+class CoverageBitmap:
+    """
+    Set of global verse indices stored as a TOTAL_AYAHS-bit integer: verse i is
+    bit i - 1. Serialized little-endian to BITMAP_BYTES bytes, counted with
+    popcount over shifted/masked slices.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int = 0):
+        self.bits = bits
+
+    @classmethod
+    def from_bytes(cls, data: Optional[bytes]) -> "CoverageBitmap":
+        return cls(int.from_bytes(data, "little") if data else 0)
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int]]) -> "CoverageBitmap":
+        bitmap = cls()
+        for start, end in ranges:
+            bitmap.add_range(start, end)
+        return bitmap
+
+    def to_bytes(self) -> bytes:
+        return self.bits.to_bytes(BITMAP_BYTES, "little")
+
+    def add_range(self, start: int, end: int) -> None:
+        """Mark the inclusive global index range [start, end]"""
+        self.bits |= ((1 << (end - start + 1)) - 1) << (start - 1)
+
+    def count(self, start: int = 1, end: int = TOTAL_AYAHS) -> int:
+        """Marked verses within the inclusive global index range [start, end]"""
+        if end < start:
+            return 0
+        return ((self.bits >> (start - 1)) & ((1 << (end - start + 1)) - 1)).bit_count()
+
+    def per_surah(self) -> list[int]:
+        """Marked verses of each surah, index 0 is surah 1"""
+        return [self.count(SURAH_OFFSETS[surah] + 1, SURAH_OFFSETS[surah + 1]) for surah in range(1, SURAH_COUNT + 1)]
+
+    def per_juz(self) -> list[int]:
+        """Marked verses of each juz, index 0 is juz 1"""
+        return [self.count(JUZ_OFFSETS[juz] + 1, JUZ_OFFSETS[juz + 1]) for juz in range(1, JUZ_COUNT + 1)]
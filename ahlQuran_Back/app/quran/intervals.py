@@ -0,0 +1,21 @@
+from typing import Iterable
+
+
+def merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merge inclusive (start, end) global index intervals into sorted, disjoint ones
+    in O(n log n). Touching intervals are joined too: (1, 7) and (8, 10) give (1, 10).
+    """
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def covered_count(merged: Iterable[tuple[int, int]]) -> int:
+    """Verses covered by disjoint intervals, as returned by merge_intervals"""
+    return sum(end - start + 1 for start, end in merged)
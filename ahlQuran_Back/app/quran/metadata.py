@@ -0,0 +1,72 @@
+import json
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+# Same file as the Flutter client's lib/quran.json
+_METADATA_FILE = Path(__file__).with_name("quran.json")
+
+SURAH_COUNT = 114
+
+
+@dataclass(frozen=True)
+class Surah:
+    number: int
+    name: str
+    english_name: str
+    english_name_translation: str
+    ayah_count: int
+    revelation_type: str
+
+
+def _load_surahs() -> tuple[Surah, ...]:
+    with _METADATA_FILE.open(encoding="utf-8") as f:
+        raw = json.load(f)
+
+    surahs = tuple(
+        Surah(
+            number=entry["number"],
+            name=entry["name"],
+            english_name=entry["englishName"],
+            english_name_translation=entry["englishNameTranslation"],
+            ayah_count=entry["numberOfAyahs"],
+            revelation_type=entry["revelationType"]
+        )
+        for entry in sorted(raw, key=lambda entry: entry["number"])
+    )
+    if [surah.number for surah in surahs] != list(range(1, SURAH_COUNT + 1)):
+        raise RuntimeError(f"{_METADATA_FILE} must list surahs 1..{SURAH_COUNT} exactly once")
+    return surahs
+
+
+SURAHS = _load_surahs()
+
+# AYAH_COUNTS[s] is the number of verses of surah s (index 0 unused)
+AYAH_COUNTS = array("H", [0] + [surah.ayah_count for surah in SURAHS])
+
+# SURAH_OFFSETS[s] is the number of verses before surah s, so verse v of surah s
+# has global index SURAH_OFFSETS[s] + v; SURAH_OFFSETS[115] is the total
+SURAH_OFFSETS = array("H", [0, 0])
+for _count in AYAH_COUNTS[1:]:
+    SURAH_OFFSETS.append(SURAH_OFFSETS[-1] + _count)
+
+TOTAL_AYAHS = SURAH_OFFSETS[SURAH_COUNT + 1]
+
+# SURAH_OF_AYAH[i] is the surah holding global verse i (index 0 unused)
+SURAH_OF_AYAH = array("B", [0])
+for _surah in SURAHS:
+    SURAH_OF_AYAH.extend([_surah.number] * _surah.ayah_count)
+
+# First verse (surah, verse) of each of the 30 juz
+JUZ_STARTS = (
+    (1, 1), (2, 142), (2, 253), (3, 93), (4, 24), (4, 148), (5, 82), (6, 111),
+    (7, 88), (8, 41), (9, 93), (11, 6), (12, 53), (15, 1), (17, 1), (18, 75),
+    (21, 1), (23, 1), (25, 21), (27, 56), (29, 46), (33, 31), (36, 28), (39, 32),
+    (41, 47), (46, 1), (51, 31), (58, 1), (67, 1), (78, 1),
+)
+
+JUZ_COUNT = len(JUZ_STARTS)
+
+# JUZ_OFFSETS[j] is the number of verses before juz j (index 0 unused),
+# JUZ_OFFSETS[31] is the total
+JUZ_OFFSETS = array("H", [0] + [SURAH_OFFSETS[surah] + verse - 1 for surah, verse in JUZ_STARTS] + [TOTAL_AYAHS])
@@ -0,0 +1,40 @@
+from app.quran.metadata import AYAH_COUNTS, SURAH_COUNT, SURAH_OF_AYAH, SURAH_OFFSETS, TOTAL_AYAHS
+
+
+def is_valid_verse(surah: int, verse: int) -> bool:
+    return 1 <= surah <= SURAH_COUNT and 1 <= verse <= AYAH_COUNTS[surah]
+
+
+def global_index(surah: int, verse: int) -> int:
+    """Global verse index 1..6236 of (surah, verse), raising ValueError when it does not exist"""
+    if not 1 <= surah <= SURAH_COUNT:
+        raise ValueError(f"Surah must be between 1 and {SURAH_COUNT}")
+    if not 1 <= verse <= AYAH_COUNTS[surah]:
+        raise ValueError(f"Surah {surah} has {AYAH_COUNTS[surah]} verses, got verse {verse}")
+    return SURAH_OFFSETS[surah] + verse
+
+
+def surah_verse(index: int) -> tuple[int, int]:
+    """(surah, verse) of a global verse index"""
+    if not 1 <= index <= TOTAL_AYAHS:
+        raise ValueError(f"Global verse index must be between 1 and {TOTAL_AYAHS}")
+    surah = SURAH_OF_AYAH[index]
+    return surah, index - SURAH_OFFSETS[surah]
+
+
+def range_indices(from_surah: int, from_verse: int, to_surah: int, to_verse: int) -> tuple[int, int]:
+    """
+    Inclusive global index bounds of a verse range, raising ValueError when an
+    endpoint does not exist or the range runs backwards.
+    """
+    start = global_index(from_surah, from_verse)
+    end = global_index(to_surah, to_verse)
+    if start > end:
+        raise ValueError("Range end must not come before its start")
+    return start, end
+
+
+def verse_count(from_surah: int, from_verse: int, to_surah: int, to_verse: int) -> int:
+    """Number of verses in an inclusive range"""
+    start, end = range_indices(from_surah, from_verse, to_surah, to_verse)
+    return end - start + 1
@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field, model_validator
 from datetime import datetime
 from typing import Optional
 from enum import Enum
 
+from app.schemas.types import DayDate
+from app.quran import range_indices
+
 
 class AchievementType(str, Enum):
     NORMAL = "normal"
@@ -20,12 +23,38 @@ class AchievementBase(BaseModel):
     to_verse: int = Field(..., gt=0, example=10)
     note: Optional[str] = Field(None, example="Good memorization")
     achievement_type: AchievementType = Field(default=AchievementType.NORMAL, example="normal")
-    date: str = Field(..., description="Date in DD-MM-YYYY format", example="19-12-2024")
+    date: DayDate = Field(..., description="Date in DD-MM-YYYY format", example="19-12-2024")
 
 
 class AchievementCreate(AchievementBase):
     student_id: int = Field(..., gt=0, example=1)
 
+    @model_validator(mode="after")
+    def check_verse_range(self):
+        range_indices(self.from_surah, self.from_verse, self.to_surah, self.to_verse)
+        return self
+
+
+class LectureAchievementEntry(BaseModel):
+    student_id: int = Field(..., gt=0, example=1)
+    from_surah: int = Field(..., ge=1, le=114, example=2)
+    to_surah: int = Field(..., ge=1, le=114, example=2)
+    from_verse: int = Field(..., gt=0, example=1)
+    to_verse: int = Field(..., gt=0, example=10)
+    note: Optional[str] = Field(None, example="Good memorization")
+    achievement_type: AchievementType = Field(default=AchievementType.NORMAL, example="normal")
+
+    @model_validator(mode="after")
+    def check_verse_range(self):
+        range_indices(self.from_surah, self.from_verse, self.to_surah, self.to_verse)
+        return self
+
+
+class LectureAchievementBulk(BaseModel):
+    """Achievements of a whole lecture session for one day, several per student allowed"""
+    date: DayDate = Field(..., example="17-12-2024")  # DD-MM-YYYY
+    entries: list[LectureAchievementEntry] = Field(..., min_length=1, max_length=1000)
+
 
 class AchievementUpdate(BaseModel):
     from_surah: Optional[int] = Field(None, ge=1, le=114)  # Chapter number 1-114
@@ -34,7 +63,7 @@ class AchievementUpdate(BaseModel):
     to_verse: Optional[int] = Field(None, gt=0)
     note: Optional[str] = None
     achievement_type: Optional[AchievementType] = None
-    date: Optional[str] = Field(None, description="Date in DD-MM-YYYY format")
+    date: Optional[DayDate] = Field(None, description="Date in DD-MM-YYYY format")
 
 
 class AchievementResponse(AchievementBase):
@@ -43,6 +72,16 @@ class AchievementResponse(AchievementBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
+    @computed_field
+    @property
+    def verse_count(self) -> Optional[int]:
+        """Verses covered by the range, None for a range that does not exist"""
+        try:
+            start, end = range_indices(self.from_surah, self.from_verse, self.to_surah, self.to_verse)
+        except ValueError:
+            return None
+        return end - start + 1
+
     class Config:
         from_attributes = True
 
@@ -51,3 +90,44 @@ class AchievementList(BaseModel):
     achievements: list[AchievementResponse]
     total: int
 
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int  # Ties share a rank
+    student_id: int
+    firstname: str
+    lastname: str
+    verses_new: int = Field(
+        ..., description="Sum over the months of the distinct verses memorized in each month"
+    )
+    verses_revised: int = Field(
+        ..., description="Sum over the months of the distinct verses revised in each month"
+    )
+
+
+class Leaderboard(BaseModel):
+    """
+    Top students by verses memorized (normal achievements) or revised (small and big).
+    Verses are distinct within a month only: a verse recorded in two months of the
+    period counts twice.
+    """
+    month_from: DayDate = Field(..., example="01-09-2024")  # First day of the first month
+    month_to: DayDate = Field(..., example="01-12-2024")  # First day of the last month
+    rank_by: str = Field(..., example="new")
+    lecture_id: Optional[int] = None
+    entries: list[LeaderboardEntry]
+
+
+class ProgressPoint(BaseModel):
+    period_start: DayDate = Field(..., example="01-12-2024")  # First day of the (first) week/month
+    verses: int  # Verses recorded in the bucket, repeats included
+    new_verses: int  # Verses covered for the first time in the bucket
+    cumulative: int  # Distinct verses covered up to the end of the bucket
+
+
+class ProgressTimeline(BaseModel):
+    student_id: int
+    bucket: str = Field(..., example="month")  # week or month
+    achievement_type: Optional[AchievementType] = None  # None for every type
+    downsampled_by: int = Field(..., example=1)  # Buckets merged into each point
+    points: list[ProgressPoint]
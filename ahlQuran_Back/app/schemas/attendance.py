@@ -3,6 +3,8 @@ from datetime import datetime
 from typing import Optional
 from enum import Enum
 
+from app.schemas.types import DayDate
+
 
 class AttendanceStatus(str, Enum):
     PRESENT = "present"
@@ -15,7 +17,7 @@ class AttendanceStatus(str, Enum):
 
 
 class AttendanceBase(BaseModel):
-    date: str = Field(..., pattern=r'^\d{2}-\d{2}-\d{4}$', example="17-12-2024")  # DD-MM-YYYY
+    date: DayDate = Field(..., example="17-12-2024")  # DD-MM-YYYY
     status: AttendanceStatus = Field(default=AttendanceStatus.PRESENT, example="present")
     notes: Optional[str] = Field(None, example="Good attendance")
 
@@ -42,3 +44,64 @@ class AttendanceResponse(AttendanceBase):
 class AttendanceList(BaseModel):
     attendances: list[AttendanceResponse]
     total: int
+
+
+class LectureAttendanceEntry(BaseModel):
+    student_id: int = Field(..., gt=0, example=1)
+    status: AttendanceStatus = Field(default=AttendanceStatus.PRESENT, example="present")
+    notes: Optional[str] = Field(None, example="Good attendance")
+
+
+class LectureAttendanceBulk(BaseModel):
+    """Attendance of a whole lecture for one day"""
+    date: DayDate = Field(..., example="17-12-2024")  # DD-MM-YYYY
+    entries: list[LectureAttendanceEntry] = Field(..., min_length=1, max_length=1000)
+
+
+class AttendanceSummaryBucket(BaseModel):
+    period_start: DayDate = Field(..., example="01-12-2024")  # First day of the week/month
+    present: int = 0
+    late: int = 0
+    absent: int = 0
+    excused: int = 0
+    total: int = 0
+    attendance_rate: float = Field(0.0, description="(present + late) / total")
+
+
+class AttendanceSummary(BaseModel):
+    period: str = Field(..., example="month")  # week or month
+    buckets: list[AttendanceSummaryBucket]
+    present: int = 0
+    late: int = 0
+    absent: int = 0
+    excused: int = 0
+    total: int = 0
+    attendance_rate: float = 0.0
+
+
+class AttendanceRollupResponse(BaseModel):
+    student_id: int
+    month: DayDate = Field(..., example="01-12-2024")  # First day of the month
+    present: int
+    late: int
+    absent: int
+    excused: int
+    total: int
+    attendance_rate: float = Field(..., description="(present + late) / total")
+
+
+class AttendanceRollupList(BaseModel):
+    rollups: list[AttendanceRollupResponse]
+    total: int
+
+
+class AttendanceCalendarMonth(BaseModel):
+    month: str = Field(..., example="12-2024")  # MM-YYYY
+    days: str = Field(..., example="PPL.A..", description="One character per day of the month, see legend")
+
+
+class AttendanceCalendar(BaseModel):
+    """Compact attendance history: one packed string per month"""
+    student_id: int
+    legend: dict[str, str] = Field(..., example={"P": "present", "L": "late", "A": "absent", "E": "excused", ".": "none"})
+    months: list[AttendanceCalendarMonth]
@@ -0,0 +1,75 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class CoverageSlice(BaseModel):
+    number: int = Field(..., example=2)  # Surah or juz number
+    name: Optional[str] = Field(None, example="Al-Baqara")
+    memorized: int = Field(..., example=10)
+    total: int = Field(..., example=286)
+    percentage: float = Field(..., example=3.5)
+
+
+class MemorizationCoverageResponse(BaseModel):
+    student_id: int
+    memorized_verses: int
+    total_verses: int
+    percentage: float
+    surahs: list[CoverageSlice]
+    juz: list[CoverageSlice]
+
+
+class CoverageInterval(BaseModel):
+    start: int = Field(..., example=8)  # Global verse index 1..6236
+    end: int = Field(..., example=17)
+    from_surah: int = Field(..., example=2)
+    from_verse: int = Field(..., example=1)
+    to_surah: int = Field(..., example=2)
+    to_verse: int = Field(..., example=10)
+    verse_count: int = Field(..., example=10)
+
+
+class TypeCoverage(BaseModel):
+    verse_count: int
+    intervals: list[CoverageInterval]
+
+
+class AchievementCoverageResponse(BaseModel):
+    """Disjoint verse intervals covered by a student's achievements, per achievement type"""
+    student_id: int
+    normal: TypeCoverage
+    small: TypeCoverage
+    big: TypeCoverage
+    combined: TypeCoverage
+
+
+class StudentCoverageSummary(BaseModel):
+    """Verses covered per achievement type"""
+    student_id: int
+    normal: int
+    small: int
+    big: int
+    combined: int
+
+
+class LectureCoverageResponse(BaseModel):
+    lecture_id: int
+    students: list[StudentCoverageSummary]
+
+
+class CoveringStudent(BaseModel):
+    student_id: int
+    firstname: str
+    lastname: str
+    covered_verses: int  # Verses of the requested range covered by the student's achievements
+    complete: bool
+
+
+class CoveringStudentList(BaseModel):
+    """Students whose achievements overlap a verse range, most covered first"""
+    surah: int
+    from_verse: int
+    to_verse: int
+    verse_count: int
+    students: list[CoveringStudent]
+    total: int
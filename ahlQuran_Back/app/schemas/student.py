@@ -117,3 +117,17 @@ class StudentResponse(BaseModel):
 class StudentList(BaseModel):
     students: list[StudentResponse]
     total: int
+    next_cursor: Optional[str] = None  # Opaque keyset cursor for the next page, None on the last page
+
+
+class BulkImportRowError(BaseModel):
+    row: int  # 1-based position in the uploaded file (header excluded)
+    email: Optional[str] = None
+    errors: List[str]
+
+
+class StudentBulkImportResult(BaseModel):
+    created: int
+    failed: int
+    student_ids: List[int]
+    errors: List[BulkImportRowError]
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional
+
+from app.schemas.lecture import LectureResponse
+from app.schemas.student import StudentResponse
+from app.schemas.attendance import AttendanceResponse
+from app.schemas.achievement import AchievementResponse
+
+
+class SyncEnrollment(BaseModel):
+    id: int
+    student_id: int
+    lecture_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class SyncChanges(BaseModel):
+    """Rows created or updated since the cursor"""
+    lectures: list[LectureResponse] = []
+    students: list[StudentResponse] = []
+    enrollments: list[SyncEnrollment] = []
+    attendance: list[AttendanceResponse] = []
+    achievements: list[AchievementResponse] = []
+
+
+class SyncDeletions(BaseModel):
+    """Ids of rows deleted since the cursor"""
+    lectures: list[int] = []
+    students: list[int] = []
+    enrollments: list[int] = []
+    attendance: list[int] = []
+    achievements: list[int] = []
+
+
+class SyncResponse(BaseModel):
+    changes: SyncChanges
+    deleted: SyncDeletions
+    next_cursor: str = Field(..., description="Pass as `since` on the next call")
+    has_more: bool = Field(..., description="True when more pages remain in this sync window")
+    server_time: datetime
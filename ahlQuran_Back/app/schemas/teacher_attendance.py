@@ -2,10 +2,13 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
+from app.schemas.attendance import AttendanceStatus
+from app.schemas.types import DayDate
+
 
 class TeacherAttendanceBase(BaseModel):
     teacher_id: int
-    date: str = Field(..., description="Date in DD-MM-YYYY format")
+    date: DayDate = Field(..., description="Date in DD-MM-YYYY format")
     status: str = Field(..., description="Attendance status: present, late, absent, excused")
     notes: Optional[str] = None
 
@@ -15,7 +18,7 @@ class TeacherAttendanceCreate(TeacherAttendanceBase):
 
 
 class TeacherAttendanceUpdate(BaseModel):
-    date: Optional[str] = None
+    date: Optional[DayDate] = None
     status: Optional[str] = None
     notes: Optional[str] = None
 
@@ -32,3 +35,28 @@ class TeacherAttendanceResponse(TeacherAttendanceBase):
 class TeacherAttendanceList(BaseModel):
     attendances: list[TeacherAttendanceResponse]
     total: int
+
+
+class TeacherAttendanceEntry(BaseModel):
+    teacher_id: int = Field(..., gt=0)
+    status: AttendanceStatus = AttendanceStatus.PRESENT
+    notes: Optional[str] = None
+
+
+class TeacherAttendanceBulk(BaseModel):
+    """Attendance of several teachers for one day"""
+    date: DayDate = Field(..., description="Date in DD-MM-YYYY format")
+    entries: list[TeacherAttendanceEntry] = Field(..., min_length=1, max_length=1000)
+
+
+class TeacherAttendanceSheetRow(BaseModel):
+    teacher_id: int
+    firstname: str
+    lastname: str
+    days: list[Optional[str]] = Field(..., description="Status per day of the month, index 0 is the 1st")
+
+
+class TeacherAttendanceSheet(BaseModel):
+    month: str = Field(..., description="Month in MM-YYYY format")
+    days_in_month: int
+    teachers: list[TeacherAttendanceSheetRow]
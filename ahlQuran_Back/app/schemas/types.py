@@ -0,0 +1,36 @@
+from datetime import date, datetime
+from typing import Annotated
+
+from pydantic import BeforeValidator, PlainSerializer, WithJsonSchema
+
+# Wire format used by the mobile client for calendar days
+DAY_FORMAT = "%d-%m-%Y"
+
+
+def parse_day(value):
+    """Accept DD-MM-YYYY (client format), ISO YYYY-MM-DD or a date instance"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        for fmt in (DAY_FORMAT, "%Y-%m-%d"):
+            try:
+                return datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+        raise ValueError("Date must be in DD-MM-YYYY format")
+    raise ValueError("Invalid date")
+
+
+def format_day(value: date) -> str:
+    return value.strftime(DAY_FORMAT)
+
+
+# Stored as DATE, exchanged as DD-MM-YYYY
+DayDate = Annotated[
+    date,
+    BeforeValidator(parse_day),
+    PlainSerializer(format_day, return_type=str),
+    WithJsonSchema({"type": "string", "pattern": r"^\d{2}-\d{2}-\d{4}$", "example": "17-12-2024"}),
+]
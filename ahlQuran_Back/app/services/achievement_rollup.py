@@ -0,0 +1,117 @@
+from datetime import date, datetime, timezone
+from itertools import groupby
+from typing import Iterable
+
+from sqlalchemy import Date, cast, delete, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.acheivements import Achievement, AchievementType
+from app.models.achievement_rollup import AchievementMonthlyRollup
+from app.quran import covered_count, merge_intervals
+from app.services.coverage import lock_coverage, merge_by_type
+
+REBUILD_BATCH_SIZE = 500
+
+
+def achievement_month():
+    """First day of the month of Achievement.date"""
+    return cast(func.date_trunc(literal_column("'month'"), Achievement.date), Date)
+
+
+def rollup_source_query(*filters):
+    """Achievement rows consumed by build_rollups, ordered by student and month"""
+    month = achievement_month()
+    return (
+        select(
+            Achievement.student_id,
+            month,
+            Achievement.achievement_type,
+            Achievement.from_surah, Achievement.from_verse, Achievement.to_surah, Achievement.to_verse
+        )
+        .where(*filters)
+        .order_by(Achievement.student_id, month)
+    )
+
+
+def build_rollups(rows: Iterable) -> list[dict]:
+    """
+    Turn (student_id, month, achievement_type, from_surah, from_verse, to_surah, to_verse)
+    rows, ordered by student and month, into rollup rows. Overlapping achievements of
+    the same month are merged first so a verse is only counted once per month.
+    """
+    now = datetime.now(timezone.utc)
+    rollups = []
+    for (student_id, month), month_rows in groupby(rows, key=lambda row: (row[0], row[1])):
+        merged = merge_by_type(row[2:] for row in month_rows)
+        revised = merge_intervals(merged[AchievementType.SMALL.value] + merged[AchievementType.BIG.value])
+        rollups.append({
+            "student_id": student_id,
+            "month": month,
+            "verses_new": covered_count(merged[AchievementType.NORMAL.value]),
+            "verses_revised": covered_count(revised),
+            "updated_at": now,
+        })
+    return rollups
+
+
+async def _upsert_rollups(db: AsyncSession, rollups: list[dict]) -> None:
+    for offset in range(0, len(rollups), REBUILD_BATCH_SIZE):
+        stmt = pg_insert(AchievementMonthlyRollup).values(rollups[offset:offset + REBUILD_BATCH_SIZE])
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["student_id", "month"],
+                set_={
+                    "verses_new": stmt.excluded.verses_new,
+                    "verses_revised": stmt.excluded.verses_revised,
+                    "updated_at": stmt.excluded.updated_at,
+                }
+            )
+        )
+
+
+async def refresh_achievement_rollups(db: AsyncSession, keys: Iterable[tuple[int, date]]) -> None:
+    """
+    Recompute the rollup rows covering the given (student_id, achievement date) pairs
+    inside the caller's transaction. Call after the achievement changes are flushed
+    and before commit.
+
+    Each student's coverage row is locked first, in student order, so two concurrent
+    writes of the same student cannot both read the month before either commits and
+    leave the rollup without one of them.
+    """
+    months = {(student_id, day.replace(day=1)) for student_id, day in keys}
+    if not months:
+        return
+
+    for student_id in sorted({student_id for student_id, _ in months}):
+        await lock_coverage(db, student_id)
+
+    result = await db.execute(
+        rollup_source_query(
+            # Plain student filter lets the planner use the (student_id, date) index
+            Achievement.student_id.in_({student_id for student_id, _ in months}),
+            tuple_(Achievement.student_id, achievement_month()).in_(months)
+        )
+    )
+    rollups = build_rollups(result.all())
+    await _upsert_rollups(db, rollups)
+
+    # Months left without any achievement disappear from the rollup
+    emptied = months - {(rollup["student_id"], rollup["month"]) for rollup in rollups}
+    if emptied:
+        await db.execute(
+            delete(AchievementMonthlyRollup)
+            .where(tuple_(AchievementMonthlyRollup.student_id, AchievementMonthlyRollup.month).in_(emptied))
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def rebuild_achievement_rollups(db: AsyncSession) -> int:
+    """Recompute every rollup row from scratch, returns the number of rows written"""
+    result = await db.execute(rollup_source_query())
+    rollups = build_rollups(result.all())
+
+    await db.execute(delete(AchievementMonthlyRollup))
+    await _upsert_rollups(db, rollups)
+    return len(rollups)
@@ -0,0 +1,124 @@
+import calendar
+from datetime import date
+from typing import Iterable, Type
+
+from sqlalchemy import Date, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attendance import AttendanceStatus
+from app.schemas.attendance import AttendanceSummary, AttendanceSummaryBucket, AttendanceCalendarMonth
+
+# Buckets accepted by summarize_attendance, passed to date_trunc
+SUMMARY_PERIODS = ("week", "month")
+
+# One character per day in the calendar format
+CALENDAR_CODES = {
+    AttendanceStatus.PRESENT.value: "P",
+    AttendanceStatus.LATE.value: "L",
+    AttendanceStatus.ABSENT.value: "A",
+    AttendanceStatus.EXCUSED.value: "E",
+}
+CALENDAR_NO_RECORD = "."
+CALENDAR_LEGEND = {code: status for status, code in CALENDAR_CODES.items()} | {CALENDAR_NO_RECORD: "none"}
+
+
+async def upsert_attendances(db: AsyncSession, model: Type, owner_column: str, rows: list[dict]) -> list:
+    """
+    Insert or update attendance rows of model in a single
+    INSERT ... ON CONFLICT (owner_column, date) DO UPDATE statement.
+
+    Rows must be unique on (owner_column, date). Returns the resulting ORM objects,
+    refreshed in the session identity map.
+    """
+    if not rows:
+        return []
+
+    stmt = pg_insert(model).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[owner_column, "date"],
+        set_={
+            "status": stmt.excluded.status,
+            "notes": stmt.excluded.notes,
+            "updated_at": func.now(),
+        }
+    ).returning(model)
+
+    result = await db.scalars(stmt, execution_options={"populate_existing": True})
+    return list(result)
+
+
+async def summarize_attendance(db: AsyncSession, model: Type, filters: list, period: str) -> list[dict]:
+    """
+    Count attendance rows of model per status for every week or month matching
+    filters, in one GROUP BY query. Weeks start on Monday.
+
+    Returns one dict per bucket, oldest first, with period_start, a count per
+    AttendanceStatus value and total.
+    """
+    if period not in SUMMARY_PERIODS:
+        raise ValueError(f"Unsupported summary period: {period}")
+
+    # Inlined so the GROUP BY expression matches the selected one exactly
+    period_start = cast(func.date_trunc(literal_column(f"'{period}'"), model.date), Date).label("period_start")
+    status_counts = [
+        func.count().filter(model.status == attendance_status.value).label(attendance_status.value)
+        for attendance_status in AttendanceStatus
+    ]
+
+    result = await db.execute(
+        select(period_start, *status_counts, func.count().label("total"))
+        .where(*filters)
+        .group_by(period_start)
+        .order_by(period_start)
+    )
+    return [dict(row._mapping) for row in result.all()]
+
+
+def attendance_rate(counts: dict) -> float:
+    """Share of sessions attended, late arrivals included"""
+    if not counts["total"]:
+        return 0.0
+    return round((counts["present"] + counts["late"]) / counts["total"], 4)
+
+
+def build_attendance_summary(period: str, buckets: list[dict]) -> AttendanceSummary:
+    """Wrap summarize_attendance buckets with rates and overall totals"""
+    keys = [attendance_status.value for attendance_status in AttendanceStatus] + ["total"]
+    totals = {key: sum(bucket[key] for bucket in buckets) for key in keys}
+
+    return AttendanceSummary(
+        period=period,
+        buckets=[
+            AttendanceSummaryBucket(**bucket, attendance_rate=attendance_rate(bucket))
+            for bucket in buckets
+        ],
+        **totals,
+        attendance_rate=attendance_rate(totals)
+    )
+
+
+def encode_attendance_calendar(rows: Iterable[tuple[date, str]]) -> list[AttendanceCalendarMonth]:
+    """
+    Pack (date, status) rows ordered by date into one string per month holding a
+    status code per day. Months without any attendance are omitted.
+    """
+    months = []
+    current_month = None
+    days = None
+
+    def close_month():
+        year, month = current_month
+        months.append(AttendanceCalendarMonth(month=f"{month:02d}-{year}", days="".join(days)))
+
+    for day, attendance_status in rows:
+        if (day.year, day.month) != current_month:
+            if days is not None:
+                close_month()
+            current_month = (day.year, day.month)
+            days = [CALENDAR_NO_RECORD] * calendar.monthrange(day.year, day.month)[1]
+        days[day.day - 1] = CALENDAR_CODES[str(attendance_status)]
+
+    if days is not None:
+        close_month()
+    return months
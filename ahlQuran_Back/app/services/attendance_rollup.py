@@ -0,0 +1,100 @@
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import Date, cast, delete, func, insert, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.attendance_rollup import AttendanceMonthlyRollup
+
+ROLLUP_COLUMNS = ["student_id", "month", "present", "late", "absent", "excused", "total", "updated_at"]
+
+
+def attendance_month():
+    """First day of the month of Attendance.date"""
+    return cast(func.date_trunc(literal_column("'month'"), Attendance.date), Date)
+
+
+def aggregated_rollups(*filters):
+    """SELECT producing rollup rows (in ROLLUP_COLUMNS order) from attendances"""
+    month = attendance_month()
+    return (
+        select(
+            Attendance.student_id,
+            month,
+            *[
+                func.count().filter(Attendance.status == attendance_status.value)
+                for attendance_status in AttendanceStatus
+            ],
+            func.count(),
+            func.now()
+        )
+        .where(*filters)
+        .group_by(Attendance.student_id, month)
+    )
+
+
+def month_key(month: date) -> int:
+    """Integer key of a month, used as the second advisory lock key"""
+    return month.year * 12 + month.month - 1
+
+
+async def refresh_attendance_rollups(db: AsyncSession, keys: Iterable[tuple[int, date]]) -> None:
+    """
+    Recompute the rollup rows covering the given (student_id, attendance date) pairs
+    inside the caller's transaction. Call after the attendance changes are flushed
+    and before commit.
+    """
+    months = {(student_id, day.replace(day=1)) for student_id, day in keys}
+    if not months:
+        return
+
+    # The aggregate only sees attendances committed before it runs, so two writers of
+    # the same month must refresh one after the other or the later commit can be left
+    # out of the rollup. Keys are locked in order so concurrent requests cannot deadlock.
+    for student_id, month in sorted(months):
+        await db.execute(select(func.pg_advisory_xact_lock(student_id, month_key(month))))
+
+    stmt = pg_insert(AttendanceMonthlyRollup).from_select(
+        ROLLUP_COLUMNS,
+        aggregated_rollups(
+            # Plain student filter lets the planner use the (student_id, date) index
+            Attendance.student_id.in_({student_id for student_id, _ in months}),
+            tuple_(Attendance.student_id, attendance_month()).in_(months)
+        )
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["student_id", "month"],
+            set_={column: stmt.excluded[column] for column in ROLLUP_COLUMNS[2:]}
+        )
+    )
+
+    # Months left without any attendance disappear from the rollup
+    remaining = (
+        select(Attendance.id)
+        .where(
+            Attendance.student_id == AttendanceMonthlyRollup.student_id,
+            Attendance.date >= AttendanceMonthlyRollup.month,
+            Attendance.date < AttendanceMonthlyRollup.month + literal_column("interval '1 month'")
+        )
+        .exists()
+    )
+    await db.execute(
+        delete(AttendanceMonthlyRollup)
+        .where(
+            tuple_(AttendanceMonthlyRollup.student_id, AttendanceMonthlyRollup.month).in_(months),
+            ~remaining
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebuild_attendance_rollups(db: AsyncSession) -> int:
+    """Recompute every rollup row from scratch, returns the number of rows written"""
+    await db.execute(delete(AttendanceMonthlyRollup))
+    result = await db.execute(
+        insert(AttendanceMonthlyRollup).from_select(ROLLUP_COLUMNS, aggregated_rollups())
+    )
+    return result.rowcount
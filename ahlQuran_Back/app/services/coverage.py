@@ -0,0 +1,146 @@
+from datetime import datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.acheivements import Achievement, AchievementType
+from app.models.memorization_coverage import MemorizationCoverage
+from app.quran import CoverageBitmap, range_indices, merge_intervals
+
+REBUILD_BATCH_SIZE = 500
+
+
+def achievement_ranges(rows: Iterable) -> list[tuple[int, int]]:
+    """Global index ranges of (from_surah, from_verse, to_surah, to_verse) rows, skipping invalid ones"""
+    ranges = []
+    for from_surah, from_verse, to_surah, to_verse in rows:
+        try:
+            ranges.append(range_indices(from_surah, from_verse, to_surah, to_verse))
+        except ValueError:
+            continue
+    return ranges
+
+
+async def lock_coverage(db: AsyncSession, student_id: int) -> MemorizationCoverage:
+    """
+    Return the student's coverage row, created empty if needed, locked FOR UPDATE so
+    concurrent achievement writes of the same student are applied one after another.
+    This row lock is the per-student lock for every structure derived from achievements.
+    """
+    await db.execute(
+        pg_insert(MemorizationCoverage)
+        .values(student_id=student_id, bitmap=CoverageBitmap().to_bytes(), verse_count=0)
+        .on_conflict_do_nothing(index_elements=["student_id"])
+    )
+    result = await db.execute(
+        select(MemorizationCoverage)
+        .where(MemorizationCoverage.student_id == student_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+def _store(coverage: MemorizationCoverage, bitmap: CoverageBitmap) -> None:
+    coverage.bitmap = bitmap.to_bytes()
+    coverage.verse_count = bitmap.count()
+    coverage.updated_at = datetime.now(timezone.utc)
+
+
+async def add_to_coverage(db: AsyncSession, student_id: int, ranges: Iterable[tuple[int, int]]) -> None:
+    """Incrementally mark newly achieved global index ranges, inside the caller's transaction"""
+    coverage = await lock_coverage(db, student_id)
+    bitmap = CoverageBitmap.from_bytes(coverage.bitmap)
+    for start, end in ranges:
+        bitmap.add_range(start, end)
+    _store(coverage, bitmap)
+
+
+async def recompute_coverage(db: AsyncSession, student_id: int) -> None:
+    """
+    Rebuild a student's coverage from their achievements, inside the caller's
+    transaction. Needed after an update or delete since overlapping ranges make
+    un-marking verses impossible incrementally. Call after the change is flushed.
+    """
+    coverage = await lock_coverage(db, student_id)
+    result = await db.execute(
+        select(Achievement.from_surah, Achievement.from_verse, Achievement.to_surah, Achievement.to_verse)
+        .where(Achievement.student_id == student_id)
+    )
+    _store(coverage, CoverageBitmap.from_ranges(achievement_ranges(result.all())))
+
+
+async def rebuild_all_coverage(db: AsyncSession) -> int:
+    """Recompute the coverage of every student with achievements, returns the number of students"""
+    result = await db.execute(
+        select(
+            Achievement.student_id,
+            Achievement.from_surah, Achievement.from_verse, Achievement.to_surah, Achievement.to_verse
+        ).order_by(Achievement.student_id)
+    )
+
+    ranges_by_student: dict[int, list] = {}
+    for student_id, *verse_range in result.all():
+        ranges_by_student.setdefault(student_id, []).append(verse_range)
+
+    await db.execute(
+        MemorizationCoverage.__table__.delete()
+        .where(MemorizationCoverage.student_id.notin_(ranges_by_student))
+    )
+    rows = []
+    for student_id, verse_ranges in ranges_by_student.items():
+        bitmap = CoverageBitmap.from_ranges(achievement_ranges(verse_ranges))
+        rows.append({
+            "student_id": student_id,
+            "bitmap": bitmap.to_bytes(),
+            "verse_count": bitmap.count(),
+            "updated_at": datetime.now(timezone.utc),
+        })
+
+    for offset in range(0, len(rows), REBUILD_BATCH_SIZE):
+        stmt = pg_insert(MemorizationCoverage).values(rows[offset:offset + REBUILD_BATCH_SIZE])
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["student_id"],
+                set_={
+                    "bitmap": stmt.excluded.bitmap,
+                    "verse_count": stmt.excluded.verse_count,
+                    "updated_at": stmt.excluded.updated_at,
+                }
+            )
+        )
+    return len(rows)
+
+
+COMBINED = "combined"
+
+
+def merge_by_type(rows: Iterable) -> dict[str, list[tuple[int, int]]]:
+    """
+    Merge (achievement_type, from_surah, from_verse, to_surah, to_verse) rows into
+    disjoint global index intervals for each AchievementType and for all of them
+    combined. Invalid ranges are skipped.
+    """
+    ranges: dict[str, list] = {achievement_type.value: [] for achievement_type in AchievementType}
+    for achievement_type, *verse_range in rows:
+        ranges[str(achievement_type)].extend(achievement_ranges([verse_range]))
+
+    merged = {achievement_type: merge_intervals(type_ranges) for achievement_type, type_ranges in ranges.items()}
+    # Merging the already merged lists keeps the combined pass small
+    merged[COMBINED] = merge_intervals(interval for intervals in merged.values() for interval in intervals)
+    return merged
+
+
+def achievement_coverage_query(*filters):
+    """Achievement columns consumed by merge_by_type, ordered by student"""
+    return (
+        select(
+            Achievement.student_id,
+            Achievement.achievement_type,
+            Achievement.from_surah, Achievement.from_verse, Achievement.to_surah, Achievement.to_verse
+        )
+        .where(*filters)
+        .order_by(Achievement.student_id)
+    )
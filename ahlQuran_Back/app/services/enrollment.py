@@ -0,0 +1,65 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.lecture import Lecture
+from app.models.sessionParticipation import SessionParticipation
+
+
+def actual_student_count():
+    """Correlated count of distinct students enrolled in the enclosing Lecture row"""
+    return (
+        select(func.count(func.distinct(SessionParticipation.student_id)))
+        .where(SessionParticipation.lecture_id == Lecture.id)
+        .correlate(Lecture)
+        .scalar_subquery()
+    )
+
+
+async def refresh_lecture_student_counts(db: AsyncSession, lecture_ids: Iterable[Optional[int]]) -> None:
+    """
+    Recompute lectures.student_count for the given lectures inside the caller's transaction.
+    Call after participations have been flushed and before commit.
+
+    The lectures are locked by a separate statement first. The count is then taken
+    with a snapshot that includes every enrollment committed by a concurrent writer
+    of the same lecture. Otherwise the UPDATE would recheck the locked row but keep
+    the subquery's stale count.
+    """
+    ids = {lecture_id for lecture_id in lecture_ids if lecture_id is not None}
+    if not ids:
+        return
+
+    await db.execute(
+        select(Lecture.id).where(Lecture.id.in_(ids)).order_by(Lecture.id).with_for_update()
+    )
+    await db.execute(
+        update(Lecture)
+        .where(Lecture.id.in_(ids))
+        # Keep updated_at untouched, an enrollment change is not an edit of the lecture
+        # (the changed_at trigger still reports the new count to the sync API)
+        .values(student_count=actual_student_count(), updated_at=Lecture.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebuild_lecture_student_counts(db: AsyncSession) -> int:
+    """Recompute every lecture counter from scratch, returns the number of lectures updated"""
+    result = await db.execute(
+        update(Lecture)
+        .values(student_count=actual_student_count(), updated_at=Lecture.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def find_lecture_count_drift(db: AsyncSession) -> list[tuple[int, int, int]]:
+    """Return (lecture_id, stored, actual) for every lecture whose counter is out of sync"""
+    actual = actual_student_count()
+    result = await db.execute(
+        select(Lecture.id, Lecture.student_count, actual)
+        .where(Lecture.student_count != actual)
+        .order_by(Lecture.id)
+    )
+    return [tuple(row) for row in result.all()]
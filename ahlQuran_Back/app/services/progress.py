@@ -0,0 +1,122 @@
+import math
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import Date, Integer, cast, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dates import day_filters
+from app.models.acheivements import Achievement
+
+TIMELINE_BUCKETS = ("week", "month")
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """First day of the week (Monday) or month holding day, as date_trunc computes it"""
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+async def progress_timeline(
+    db: AsyncSession,
+    student_id: int,
+    bucket: str,
+    achievement_type: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+) -> list[dict]:
+    """
+    Progress of a student per week or month, oldest first, optionally for one
+    achievement type. Each bucket has:
+
+    - verses: verses recorded in the bucket, a verse recorded twice counts twice
+    - new_verses: verses covered for the first time in the bucket
+    - cumulative: distinct verses covered up to the end of the bucket, the same
+      figure as the coverage bitmap when every type is included
+
+    The running coverage is a range_agg window over the whole history, so it stays
+    correct when `date_from` cuts off earlier buckets. Achievements whose range does
+    not exist in the Quran are ignored.
+    """
+    if bucket not in TIMELINE_BUCKETS:
+        raise ValueError(f"Unsupported timeline bucket: {bucket}")
+
+    filters = [Achievement.student_id == student_id, Achievement.verse_range.isnot(None)]
+    if achievement_type is not None:
+        filters.append(Achievement.achievement_type == achievement_type)
+
+    period_start = cast(func.date_trunc(literal_column(f"'{bucket}'"), Achievement.date), Date)
+
+    # Verses covered up to the end of each achievement's bucket: the default window
+    # frame includes every achievement of the same bucket
+    covered = (
+        select(
+            period_start.label("period_start"),
+            Achievement.verse_range,
+            func.range_agg(Achievement.verse_range).over(order_by=period_start).label("covered")
+        )
+        .where(*filters)
+        .subquery()
+    )
+    piece = func.unnest(covered.c.covered).column_valued("piece")
+    # Discrete ranges are normalized to [lower, upper)
+    covered_count = select(func.sum(func.upper(piece) - func.lower(piece))).scalar_subquery()
+
+    timeline = (
+        select(
+            covered.c.period_start,
+            cast(
+                func.sum(func.upper(covered.c.verse_range) - func.lower(covered.c.verse_range)), Integer
+            ).label("verses"),
+            # Identical for every achievement of the bucket
+            cast(func.max(covered_count), Integer).label("cumulative")
+        )
+        .group_by(covered.c.period_start)
+        .subquery()
+    )
+    previous = func.lag(timeline.c.cumulative, 1, 0).over(order_by=timeline.c.period_start)
+
+    points = (
+        select(
+            timeline.c.period_start,
+            timeline.c.verses,
+            (timeline.c.cumulative - previous).label("new_verses"),
+            timeline.c.cumulative
+        )
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(points)
+        .where(*day_filters(
+            points.c.period_start,
+            date_from=bucket_start(date_from, bucket) if date_from else None,
+            date_to=date_to
+        ))
+        .order_by(points.c.period_start)
+    )
+    return [dict(row._mapping) for row in result.all()]
+
+
+def downsample_timeline(points: list[dict], max_points: int) -> tuple[list[dict], int]:
+    """
+    Merge runs of consecutive buckets so at most max_points remain. A merged point
+    starts with its first bucket, sums their verses and new verses and keeps the
+    last running total.
+    Returns the points and the number of buckets merged into each one.
+    """
+    factor = max(1, math.ceil(len(points) / max_points))
+    if factor == 1:
+        return points, factor
+
+    merged = []
+    for offset in range(0, len(points), factor):
+        run = points[offset:offset + factor]
+        merged.append({
+            "period_start": run[0]["period_start"],
+            "verses": sum(point["verses"] for point in run),
+            "new_verses": sum(point["new_verses"] for point in run),
+            "cumulative": run[-1]["cumulative"],
+        })
+    return merged, factor
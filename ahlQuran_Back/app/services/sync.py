@@ -0,0 +1,320 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.models.acheivements import Achievement
+from app.models.attendance import Attendance
+from app.models.lecture import Lecture, lecture_teachers
+from app.models.sessionParticipation import SessionParticipation
+from app.models.student import Student
+from app.models.sync_tombstone import SyncTombstone
+from app.models.teacher import Teacher
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class SyncScope:
+    """Restricts synced rows to the lectures taught by one teacher; None means everything"""
+    teacher_id: int
+
+    def lecture_ids(self):
+        return select(lecture_teachers.c.lecture_id).where(lecture_teachers.c.teacher_id == self.teacher_id)
+
+    def student_ids(self):
+        return select(SessionParticipation.student_id).where(
+            SessionParticipation.lecture_id.in_(self.lecture_ids())
+        )
+
+    async def fingerprint(self, db: AsyncSession) -> str:
+        """
+        Digest of the lectures and students in scope. Stored in the cursor so a scope
+        change, whose older rows sit behind the cursor, can be detected.
+        """
+        result = await db.execute(self.lecture_ids().order_by(lecture_teachers.c.lecture_id))
+        lecture_ids = result.scalars().all()
+        result = await db.execute(self.student_ids().distinct().order_by(SessionParticipation.student_id))
+        student_ids = result.scalars().all()
+
+        raw = f"{self.teacher_id}|{lecture_ids}|{student_ids}".encode()
+        return hashlib.sha1(raw).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class SyncEntity:
+    name: str
+    table_name: str
+    model: Any
+    changed_at: Callable[[], Any]
+    query: Callable[[Optional[SyncScope]], Select]
+
+
+def _lectures_query(scope: Optional[SyncScope]) -> Select:
+    query = select(Lecture).options(
+        selectinload(Lecture.teachers).selectinload(Teacher.user),
+        selectinload(Lecture.schedules)
+    )
+    if scope is not None:
+        query = query.where(Lecture.id.in_(scope.lecture_ids()))
+    return query
+
+
+def _students_query(scope: Optional[SyncScope]) -> Select:
+    query = select(Student).join(User, User.id == Student.user_id).options(
+        selectinload(Student.user),
+        selectinload(Student.participations).selectinload(SessionParticipation.lecture)
+    )
+    if scope is not None:
+        query = query.where(Student.id.in_(scope.student_ids()))
+    return query
+
+
+def _enrollments_query(scope: Optional[SyncScope]) -> Select:
+    query = select(SessionParticipation).where(SessionParticipation.lecture_id.isnot(None))
+    if scope is not None:
+        query = query.where(SessionParticipation.lecture_id.in_(scope.lecture_ids()))
+    return query
+
+
+def _attendance_query(scope: Optional[SyncScope]) -> Select:
+    query = select(Attendance)
+    if scope is not None:
+        query = query.where(Attendance.student_id.in_(scope.student_ids()))
+    return query
+
+
+def _achievements_query(scope: Optional[SyncScope]) -> Select:
+    query = select(Achievement)
+    if scope is not None:
+        query = query.where(Achievement.student_id.in_(scope.student_ids()))
+    return query
+
+
+def _lecture_changed_at():
+    """Lecture change time, including renames of its teachers which are rendered with it"""
+    teachers_changed_at = (
+        select(func.max(User.updated_at))
+        .select_from(lecture_teachers)
+        .join(Teacher, Teacher.id == lecture_teachers.c.teacher_id)
+        .join(User, User.id == Teacher.user_id)
+        .where(lecture_teachers.c.lecture_id == Lecture.id)
+        .correlate(Lecture)
+        .scalar_subquery()
+    )
+    # greatest() ignores the NULL of a lecture without teachers
+    return func.greatest(Lecture.changed_at, teachers_changed_at)
+
+
+# Synced in this order; the cursor stores the index of the entity being paged
+SYNC_ENTITIES = [
+    SyncEntity(
+        "lectures", "lectures", Lecture,
+        # Trigger-maintained, moves with student_count, teachers and schedules too
+        _lecture_changed_at,
+        _lectures_query
+    ),
+    SyncEntity(
+        "students", "students", Student,
+        # Names and e-mail live on the user row
+        lambda: func.greatest(Student.updated_at, User.updated_at),
+        _students_query
+    ),
+    SyncEntity(
+        "enrollments", "session_participations", SessionParticipation,
+        lambda: func.coalesce(SessionParticipation.updated_at, SessionParticipation.marked_at),
+        _enrollments_query
+    ),
+    SyncEntity(
+        "attendance", "attendances", Attendance,
+        lambda: func.coalesce(Attendance.updated_at, Attendance.created_at),
+        _attendance_query
+    ),
+    SyncEntity(
+        "achievements", "achievements", Achievement,
+        lambda: func.coalesce(Achievement.updated_at, Achievement.created_at),
+        _achievements_query
+    ),
+]
+
+ENTITY_BY_TABLE = {entity.table_name: entity.name for entity in SYNC_ENTITIES}
+
+# Pseudo entity paged after every table: deletions
+TOMBSTONES = len(SYNC_ENTITIES)
+
+
+@dataclass
+class SyncCursor:
+    """
+    Position in a sync window (since, until]. entity/after locate the next page
+    inside the window; a cursor with until=None starts a new window.
+    """
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    entity: int = 0
+    after: Optional[tuple[datetime, int]] = None
+    scope: Optional[str] = None  # SyncScope.fingerprint the cursor was issued for
+
+    def encode(self) -> str:
+        data = {
+            "since": self.since.isoformat() if self.since else None,
+            "until": self.until.isoformat() if self.until else None,
+            "entity": self.entity,
+            "after": [self.after[0].isoformat(), self.after[1]] if self.after else None,
+            "scope": self.scope,
+        }
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "SyncCursor":
+        """Decode a cursor produced by encode, raising 400 if it is malformed"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            after = data["after"]
+            decoded = cls(
+                since=datetime.fromisoformat(data["since"]) if data["since"] else None,
+                until=datetime.fromisoformat(data["until"]) if data["until"] else None,
+                entity=int(data["entity"]),
+                after=(datetime.fromisoformat(after[0]), int(after[1])) if after else None,
+                scope=data.get("scope")
+            )
+            if not 0 <= decoded.entity <= TOMBSTONES:
+                raise ValueError("entity out of range")
+            # Naive timestamps cannot be compared with server time or changed_at
+            timestamps = [decoded.since, decoded.until, decoded.after[0] if decoded.after else None]
+            if any(timestamp is not None and timestamp.utcoffset() is None for timestamp in timestamps):
+                raise ValueError("timestamp without timezone")
+            return decoded
+        except (ValueError, KeyError, TypeError, IndexError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid sync cursor"
+            )
+
+
+@dataclass
+class SyncPage:
+    changes: dict[str, list]
+    deleted: dict[str, list[int]]
+    next_cursor: SyncCursor
+    has_more: bool
+    server_time: datetime
+
+
+def _window_filters(changed_at, since: Optional[datetime], until: datetime, after, id_column) -> list:
+    filters = [changed_at <= until]
+    if since is not None:
+        filters.append(changed_at > since)
+    if after is not None:
+        filters.append(tuple_(changed_at, id_column) > tuple_(*after))
+    return filters
+
+
+async def collect_changes(
+    db: AsyncSession,
+    cursor: Optional[SyncCursor],
+    limit: int,
+    scope: Optional[SyncScope] = None
+) -> SyncPage:
+    """
+    Collect up to limit changed rows (and tombstones) for the sync window of cursor,
+    walking the entities in SYNC_ENTITIES order with a (changed_at, id) keyset.
+
+    Without cursor, every row is returned and deletions are skipped. When the window
+    is exhausted the next cursor opens a new window starting SYNC_OVERLAP_SECONDS
+    before its end, so rows committed late are re-sent rather than missed; clients
+    apply changes as idempotent upserts.
+
+    A scoped cursor is only valid while the scope is unchanged: rows of a lecture or
+    student that joined the scope are older than the cursor, and rows that left it
+    would stay on the client, so any change requires a full sync (410).
+    """
+    server_time = datetime.now(timezone.utc)
+    scope_fingerprint = await scope.fingerprint(db) if scope is not None else None
+
+    if cursor is not None and cursor.scope != scope_fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync scope changed, a full sync is required"
+        )
+    cursor = cursor or SyncCursor(scope=scope_fingerprint)
+
+    if cursor.since is not None and cursor.since < server_time - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync cursor expired, a full sync is required"
+        )
+
+    until = cursor.until or server_time
+    changes = {entity.name: [] for entity in SYNC_ENTITIES}
+    deleted = {entity.name: [] for entity in SYNC_ENTITIES}
+    remaining = limit
+    entity_index = cursor.entity
+    after = cursor.after
+
+    while entity_index < TOMBSTONES:
+        entity = SYNC_ENTITIES[entity_index]
+        changed_at = entity.changed_at()
+        result = await db.execute(
+            entity.query(scope)
+            .add_columns(changed_at)
+            .where(*_window_filters(changed_at, cursor.since, until, after, entity.model.id))
+            .order_by(changed_at, entity.model.id)
+            .limit(remaining)
+        )
+        rows = result.all()
+        changes[entity.name].extend(row[0] for row in rows)
+        remaining -= len(rows)
+
+        if remaining == 0:
+            last_row, last_changed_at = rows[-1]
+            next_cursor = SyncCursor(
+                cursor.since, until, entity_index, (last_changed_at, last_row.id), scope_fingerprint
+            )
+            return SyncPage(changes, deleted, next_cursor, True, server_time)
+
+        entity_index += 1
+        after = None
+
+    # A full sync has nothing to delete on the client
+    if cursor.since is not None:
+        query = select(SyncTombstone).where(
+            SyncTombstone.table_name.in_(ENTITY_BY_TABLE),
+            *_window_filters(SyncTombstone.deleted_at, cursor.since, until, after, SyncTombstone.id)
+        )
+        if scope is not None:
+            # @> uses the GIN index on teacher_ids
+            query = query.where(SyncTombstone.teacher_ids.contains([scope.teacher_id]))
+        result = await db.execute(
+            query.order_by(SyncTombstone.deleted_at, SyncTombstone.id).limit(remaining)
+        )
+        tombstones = result.scalars().all()
+        for tombstone in tombstones:
+            deleted[ENTITY_BY_TABLE[tombstone.table_name]].append(tombstone.row_id)
+
+        if len(tombstones) == remaining:
+            last = tombstones[-1]
+            next_cursor = SyncCursor(cursor.since, until, TOMBSTONES, (last.deleted_at, last.id), scope_fingerprint)
+            return SyncPage(changes, deleted, next_cursor, True, server_time)
+
+    next_cursor = SyncCursor(
+        since=until - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS),
+        scope=scope_fingerprint
+    )
+    return SyncPage(changes, deleted, next_cursor, False, server_time)
+
+
+async def prune_sync_tombstones(db: AsyncSession) -> int:
+    """Delete tombstones older than the retention period, returns the number removed"""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    result = await db.execute(delete(SyncTombstone).where(SyncTombstone.deleted_at < cutoff))
+    return result.rowcount